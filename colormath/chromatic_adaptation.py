@@ -8,6 +8,10 @@ from colormath import color_constants
 
 logger = logging.getLogger(__name__)
 
+# Adaptation matrices that have already been calculated, keyed by the source
+# and destination white points and the adaptation method.
+_ADAPTATION_MATRIX_CACHE = {}
+
 
 # noinspection PyPep8Naming
 def _get_adaptation_matrix(wp_src, wp_dst, observer, adaptation):
@@ -38,6 +42,14 @@ def _get_adaptation_matrix(wp_src, wp_dst, observer, adaptation):
     elif hasattr(wp_dst, "__iter__"):
         wp_dst = wp_dst
 
+    # The matrix only depends on the white points and the adaptation, so
+    # only calculate it (and the pseudo-inverse it needs) once.
+    cache_key = (tuple(wp_src), tuple(wp_dst), adaptation)
+    try:
+        return _ADAPTATION_MATRIX_CACHE[cache_key]
+    except KeyError:
+        pass
+
     # Sharpened cone responses ~ rho gamma beta ~ sharpened r g b
     rgb_src = numpy.dot(m_sharp, wp_src)
     rgb_dst = numpy.dot(m_sharp, wp_dst)
@@ -47,7 +59,11 @@ def _get_adaptation_matrix(wp_src, wp_dst, observer, adaptation):
 
     # Final transformation matrix
     m_xfm = numpy.dot(numpy.dot(pinv(m_sharp), m_rat), m_sharp)
+    # The cached matrix is shared between callers, so keep it from being
+    # modified by accident.
+    m_xfm.setflags(write=False)
 
+    _ADAPTATION_MATRIX_CACHE[cache_key] = m_xfm
     return m_xfm
 
 
@@ -33,7 +33,7 @@ from colormath.color_objects import (
     SpectralColor,
     BT2020Color,
 )
-from colormath.chromatic_adaptation import apply_chromatic_adaptation
+from colormath.chromatic_adaptation import _get_adaptation_matrix
 from colormath.color_exceptions import InvalidIlluminantError, UndefinedConversionError
 
 
@@ -69,6 +69,34 @@ def apply_RGB_matrix(var1, var2, var3, rgb_type, convtype="xyz_to_rgb"):
     return rgb_r, rgb_g, rgb_b
 
 
+# XYZ to RGB matrices with the chromatic adaptation to the RGB space's
+# native illuminant already folded in, keyed by (RGB class, XYZ illuminant).
+_ADAPTED_XYZ_TO_RGB_MATRICES = {}
+
+
+# noinspection PyPep8Naming
+def _get_adapted_xyz_to_rgb_matrix(rgb_type, illuminant):
+    """
+    Returns the single matrix that adapts XYZ values from `illuminant` to
+    the native illuminant of `rgb_type` and then converts them to linear RGB.
+
+    Both steps are linear, so their product is computed once per
+    (rgb_type, illuminant) pair and cached.
+    """
+    key = (rgb_type, illuminant)
+    try:
+        return _ADAPTED_XYZ_TO_RGB_MATRICES[key]
+    except KeyError:
+        pass
+
+    adaptation_matrix = _get_adaptation_matrix(
+        illuminant, rgb_type.native_illuminant, "2", "bradford"
+    )
+    matrix = numpy.dot(rgb_type.conversion_matrices["xyz_to_rgb"], adaptation_matrix)
+    _ADAPTED_XYZ_TO_RGB_MATRICES[key] = matrix
+    return matrix
+
+
 class ConversionManager(object):
     __metaclass__ = ABCMeta
 
@@ -118,17 +146,29 @@ class GraphConversionManager(ConversionManager):
     def __init__(self):
         super(GraphConversionManager, self).__init__()
         self.conversion_graph = networkx.DiGraph()
+        # Conversion paths that have already been looked up, keyed by the
+        # (start_type, target_type) pair passed to get_conversion_path().
+        # The cached lists are shared between callers, so don't modify them.
+        self._conversion_path_cache = {}
 
     def get_conversion_path(self, start_type, target_type):
+        key = (start_type, target_type)
+        try:
+            return self._conversion_path_cache[key]
+        except KeyError:
+            pass
+
         start_type = self._normalise_type(start_type)
         target_type = self._normalise_type(target_type)
         try:
             # Retrieve node sequence that leads from start_type to target_type.
-            return self._find_shortest_path(start_type, target_type)
+            path = self._find_shortest_path(start_type, target_type)
         except (networkx.NetworkXNoPath, networkx.NodeNotFound):
             raise UndefinedConversionError(
                 start_type, target_type,
             )
+        self._conversion_path_cache[key] = path
+        return path
 
     def _find_shortest_path(self, start_type, target_type):
         path = networkx.shortest_path(self.conversion_graph, start_type, target_type)
@@ -146,6 +186,8 @@ class GraphConversionManager(ConversionManager):
         self.conversion_graph.add_edge(
             start_type, target_type, conversion_function=conversion_function
         )
+        # A new edge may give a shorter path between any two color spaces.
+        self._conversion_path_cache.clear()
 
 
 class DummyConversionManager(ConversionManager):
@@ -186,6 +228,107 @@ def color_conversion_function(start_type, target_type):
     return decorator
 
 
+def _lab_f(t):
+    """
+    The non-linearity applied to white point relative XYZ values by the
+    XYZ to Lab and Luv conversions.
+    """
+    if t > color_constants.CIE_E:
+        return t ** (1.0 / 3.0)
+    return 7.787 * t + 16.0 / 116.0
+
+
+def _lab_f_inverse(f):
+    """
+    The inverse of _lab_f(), as used by the Lab to XYZ conversion.
+    """
+    cubed = f * f * f
+    if cubed > color_constants.CIE_E:
+        return cubed
+    return (f - 16.0 / 116.0) / 7.787
+
+
+def _polar_coordinates(x, y):
+    """
+    Converts the chromaticity coordinates of Lab or Luv to the chroma and hue
+    angle (in degrees) of LCH. Hue angles of 0 are reported as 360.
+    """
+    chroma = math.sqrt(x * x + y * y)
+    hue = math.degrees(math.atan2(y, x))
+    if hue <= 0:
+        hue += 360
+    return chroma, hue
+
+
+# Matrices that turn a spectral distribution into XYZ values, keyed by
+# (observer, illuminant). See _get_spectral_to_xyz_matrix().
+_SPECTRAL_TO_XYZ_MATRICES = {}
+
+
+def _get_spectral_to_xyz_matrix(observer, reference_illum):
+    """
+    Builds the (3, N) matrix that turns a spectral distribution into XYZ
+    values for the given observer angle and reference illuminant.
+
+    Its rows are the standard observer's x, y and z functions multiplied by
+    the reference illuminant's power distribution, divided by the sum of the
+    weighted y function (the denominator in the XYZ integrals).
+
+    :param str observer: Observer angle. Either ``'2'`` or ``'10'``.
+    :param numpy.ndarray reference_illum: The illuminant's spectral power
+        distribution.
+    :rtype: numpy.ndarray
+    """
+    # Get the spectral distribution of the selected standard observer.
+    if observer == "10":
+        std_obs = (
+            spectral_constants.STDOBSERV_X10,
+            spectral_constants.STDOBSERV_Y10,
+            spectral_constants.STDOBSERV_Z10,
+        )
+    else:
+        # Assume 2 degree, since it is theoretically the only other possibility.
+        std_obs = (
+            spectral_constants.STDOBSERV_X2,
+            spectral_constants.STDOBSERV_Y2,
+            spectral_constants.STDOBSERV_Z2,
+        )
+
+    spectral_matrix = numpy.array(std_obs) * reference_illum
+    # The denominator is constant throughout the entire calculation for X,
+    # Y, and Z coordinates.
+    spectral_matrix /= spectral_matrix[1].sum()
+    return spectral_matrix
+
+
+def _get_standard_spectral_to_xyz_matrix(observer, illuminant):
+    """
+    Like :py:func:`_get_spectral_to_xyz_matrix`, for one of the standard
+    illuminants in :py:data:`colormath.spectral_constants.REF_ILLUM_TABLE`.
+    The matrix only depends on the observer and illuminant, so it is built
+    once for each pair.
+
+    :param str observer: Observer angle. Either ``'2'`` or ``'10'``.
+    :param str illuminant: The (lower case) name of the illuminant.
+    :rtype: numpy.ndarray
+    :raises: :py:exc:`colormath.color_exceptions.InvalidIlluminantError`
+        if there is no spectral distribution for `illuminant`.
+    """
+    key = (observer, illuminant)
+    try:
+        return _SPECTRAL_TO_XYZ_MATRICES[key]
+    except KeyError:
+        pass
+
+    try:
+        reference_illum = spectral_constants.REF_ILLUM_TABLE[illuminant]
+    except KeyError:
+        raise InvalidIlluminantError(illuminant)
+    spectral_matrix = _get_spectral_to_xyz_matrix(observer, reference_illum)
+    _SPECTRAL_TO_XYZ_MATRICES[key] = spectral_matrix
+    return spectral_matrix
+
+
 # noinspection PyPep8Naming,PyUnusedLocal
 @color_conversion_function(SpectralColor, XYZColor)
 def Spectral_to_XYZ(cobj, illuminant_override=None, *args, **kwargs):
@@ -193,47 +336,20 @@ def Spectral_to_XYZ(cobj, illuminant_override=None, *args, **kwargs):
     Converts spectral readings to XYZ.
     """
     # If the user provides an illuminant_override numpy array, use it.
-    if illuminant_override:
-        reference_illum = illuminant_override
+    if illuminant_override is not None:
+        spectral_matrix = _get_spectral_to_xyz_matrix(
+            cobj.observer, illuminant_override
+        )
     else:
         # Otherwise, look up the illuminant from known standards based
         # on the value of 'illuminant' pulled from the SpectralColor object.
-        try:
-            reference_illum = spectral_constants.REF_ILLUM_TABLE[cobj.illuminant]
-        except KeyError:
-            raise InvalidIlluminantError(cobj.illuminant)
-
-    # Get the spectral distribution of the selected standard observer.
-    if cobj.observer == "10":
-        std_obs_x = spectral_constants.STDOBSERV_X10
-        std_obs_y = spectral_constants.STDOBSERV_Y10
-        std_obs_z = spectral_constants.STDOBSERV_Z10
-    else:
-        # Assume 2 degree, since it is theoretically the only other possibility.
-        std_obs_x = spectral_constants.STDOBSERV_X2
-        std_obs_y = spectral_constants.STDOBSERV_Y2
-        std_obs_z = spectral_constants.STDOBSERV_Z2
+        spectral_matrix = _get_standard_spectral_to_xyz_matrix(
+            cobj.observer, cobj.illuminant
+        )
 
     # This is a NumPy array containing the spectral distribution of the color.
-    sample = cobj.get_numpy_array()
-
-    # The denominator is constant throughout the entire calculation for X,
-    # Y, and Z coordinates. Calculate it once and re-use.
-    denom = std_obs_y * reference_illum
-
-    # This is also a common element in the calculation whereby the sample
-    # NumPy array is multiplied by the reference illuminant's power distribution
-    # (which is also a NumPy array).
-    sample_by_ref_illum = sample * reference_illum
-
-    # Calculate the numerator of the equation to find X.
-    x_numerator = sample_by_ref_illum * std_obs_x
-    y_numerator = sample_by_ref_illum * std_obs_y
-    z_numerator = sample_by_ref_illum * std_obs_z
-
-    xyz_x = x_numerator.sum() / denom.sum()
-    xyz_y = y_numerator.sum() / denom.sum()
-    xyz_z = z_numerator.sum() / denom.sum()
+    sample = cobj.get_numpy_array()[0]
+    xyz_x, xyz_y, xyz_z = numpy.dot(spectral_matrix, sample)
 
     return XYZColor(
         xyz_x, xyz_y, xyz_z, observer=cobj.observer, illuminant=cobj.illuminant
@@ -247,13 +363,7 @@ def Lab_to_LCHab(cobj, *args, **kwargs):
     Convert from CIE Lab to LCH(ab).
     """
     lch_l = cobj.lab_l
-    lch_c = math.sqrt(math.pow(float(cobj.lab_a), 2) + math.pow(float(cobj.lab_b), 2))
-    lch_h = math.atan2(float(cobj.lab_b), float(cobj.lab_a))
-
-    if lch_h > 0:
-        lch_h = (lch_h / math.pi) * 180
-    else:
-        lch_h = 360 - (math.fabs(lch_h) / math.pi) * 180
+    lch_c, lch_h = _polar_coordinates(cobj.lab_a, cobj.lab_b)
 
     return LCHabColor(
         lch_l, lch_c, lch_h, observer=cobj.observer, illuminant=cobj.illuminant
@@ -266,29 +376,14 @@ def Lab_to_XYZ(cobj, *args, **kwargs):
     """
     Convert from Lab to XYZ
     """
-    illum = cobj.get_illuminant_xyz()
+    illum_x, illum_y, illum_z = cobj._get_illuminant_xyz_tuple()
     xyz_y = (cobj.lab_l + 16.0) / 116.0
     xyz_x = cobj.lab_a / 500.0 + xyz_y
     xyz_z = xyz_y - cobj.lab_b / 200.0
 
-    if math.pow(xyz_y, 3) > color_constants.CIE_E:
-        xyz_y = math.pow(xyz_y, 3)
-    else:
-        xyz_y = (xyz_y - 16.0 / 116.0) / 7.787
-
-    if math.pow(xyz_x, 3) > color_constants.CIE_E:
-        xyz_x = math.pow(xyz_x, 3)
-    else:
-        xyz_x = (xyz_x - 16.0 / 116.0) / 7.787
-
-    if math.pow(xyz_z, 3) > color_constants.CIE_E:
-        xyz_z = math.pow(xyz_z, 3)
-    else:
-        xyz_z = (xyz_z - 16.0 / 116.0) / 7.787
-
-    xyz_x = illum["X"] * xyz_x
-    xyz_y = illum["Y"] * xyz_y
-    xyz_z = illum["Z"] * xyz_z
+    xyz_x = illum_x * _lab_f_inverse(xyz_x)
+    xyz_y = illum_y * _lab_f_inverse(xyz_y)
+    xyz_z = illum_z * _lab_f_inverse(xyz_z)
 
     return XYZColor(
         xyz_x, xyz_y, xyz_z, observer=cobj.observer, illuminant=cobj.illuminant
@@ -302,13 +397,7 @@ def Luv_to_LCHuv(cobj, *args, **kwargs):
     Convert from CIE Luv to LCH(uv).
     """
     lch_l = cobj.luv_l
-    lch_c = math.sqrt(math.pow(cobj.luv_u, 2.0) + math.pow(cobj.luv_v, 2.0))
-    lch_h = math.atan2(float(cobj.luv_v), float(cobj.luv_u))
-
-    if lch_h > 0:
-        lch_h = (lch_h / math.pi) * 180
-    else:
-        lch_h = 360 - (math.fabs(lch_h) / math.pi) * 180
+    lch_c, lch_h = _polar_coordinates(cobj.luv_u, cobj.luv_v)
     return LCHuvColor(
         lch_l, lch_c, lch_h, observer=cobj.observer, illuminant=cobj.illuminant
     )
@@ -320,7 +409,7 @@ def Luv_to_XYZ(cobj, *args, **kwargs):
     """
     Convert from Luv to XYZ.
     """
-    illum = cobj.get_illuminant_xyz()
+    illum_x, illum_y, illum_z = cobj._get_illuminant_xyz_tuple()
     # Without Light, there is no color. Short-circuit this and avoid some
     # zero division errors in the var_a_frac calculation.
     if cobj.luv_l <= 0.0:
@@ -333,8 +422,8 @@ def Luv_to_XYZ(cobj, *args, **kwargs):
 
     # Various variables used throughout the conversion.
     cie_k_times_e = color_constants.CIE_K * color_constants.CIE_E
-    u_sub_0 = (4.0 * illum["X"]) / (illum["X"] + 15.0 * illum["Y"] + 3.0 * illum["Z"])
-    v_sub_0 = (9.0 * illum["Y"]) / (illum["X"] + 15.0 * illum["Y"] + 3.0 * illum["Z"])
+    u_sub_0 = (4.0 * illum_x) / (illum_x + 15.0 * illum_y + 3.0 * illum_z)
+    v_sub_0 = (9.0 * illum_y) / (illum_x + 15.0 * illum_y + 3.0 * illum_z)
     var_u = cobj.luv_u / (13.0 * cobj.luv_l) + u_sub_0
     var_v = cobj.luv_v / (13.0 * cobj.luv_l) + v_sub_0
 
@@ -442,15 +531,11 @@ def XYZ_to_Luv(cobj, *args, **kwargs):
         luv_u = (4.0 * temp_x) / denom
         luv_v = (9.0 * temp_y) / denom
 
-    illum = cobj.get_illuminant_xyz()
-    temp_y = temp_y / illum["Y"]
-    if temp_y > color_constants.CIE_E:
-        temp_y = math.pow(temp_y, (1.0 / 3.0))
-    else:
-        temp_y = (7.787 * temp_y) + (16.0 / 116.0)
+    illum_x, illum_y, illum_z = cobj._get_illuminant_xyz_tuple()
+    temp_y = _lab_f(temp_y / illum_y)
 
-    ref_U = (4.0 * illum["X"]) / (illum["X"] + (15.0 * illum["Y"]) + (3.0 * illum["Z"]))
-    ref_V = (9.0 * illum["Y"]) / (illum["X"] + (15.0 * illum["Y"]) + (3.0 * illum["Z"]))
+    ref_U = (4.0 * illum_x) / (illum_x + (15.0 * illum_y) + (3.0 * illum_z))
+    ref_V = (9.0 * illum_y) / (illum_x + (15.0 * illum_y) + (3.0 * illum_z))
 
     luv_l = (116.0 * temp_y) - 16.0
     luv_u = 13.0 * luv_l * (luv_u - ref_U)
@@ -467,25 +552,10 @@ def XYZ_to_Lab(cobj, *args, **kwargs):
     """
     Converts XYZ to Lab.
     """
-    illum = cobj.get_illuminant_xyz()
-    temp_x = cobj.xyz_x / illum["X"]
-    temp_y = cobj.xyz_y / illum["Y"]
-    temp_z = cobj.xyz_z / illum["Z"]
-
-    if temp_x > color_constants.CIE_E:
-        temp_x = math.pow(temp_x, (1.0 / 3.0))
-    else:
-        temp_x = (7.787 * temp_x) + (16.0 / 116.0)
-
-    if temp_y > color_constants.CIE_E:
-        temp_y = math.pow(temp_y, (1.0 / 3.0))
-    else:
-        temp_y = (7.787 * temp_y) + (16.0 / 116.0)
-
-    if temp_z > color_constants.CIE_E:
-        temp_z = math.pow(temp_z, (1.0 / 3.0))
-    else:
-        temp_z = (7.787 * temp_z) + (16.0 / 116.0)
+    illum_x, illum_y, illum_z = cobj._get_illuminant_xyz_tuple()
+    temp_x = _lab_f(cobj.xyz_x / illum_x)
+    temp_y = _lab_f(cobj.xyz_y / illum_y)
+    temp_z = _lab_f(cobj.xyz_z / illum_z)
 
     lab_l = (116.0 * temp_y) - 16.0
     lab_a = 500.0 * (temp_x - temp_y)
@@ -495,6 +565,24 @@ def XYZ_to_Lab(cobj, *args, **kwargs):
     )
 
 
+def _srgb_to_linear(V):
+    """
+    Removes the sRGB companding from a single channel value.
+    """
+    if V <= 0.04045:
+        return V / 12.92
+    return math.pow((V + 0.055) / 1.055, 2.4)
+
+
+def _linear_to_srgb(v):
+    """
+    Applies the sRGB companding to a single linear channel value.
+    """
+    if v <= 0.0031308:
+        return v * 12.92
+    return 1.055 * math.pow(v, 1 / 2.4) - 0.055
+
+
 # noinspection PyPep8Naming,PyUnusedLocal
 @color_conversion_function(XYZColor, BaseRGBColor)
 def XYZ_to_RGB(cobj, target_rgb, *args, **kwargs):
@@ -519,48 +607,40 @@ def XYZ_to_RGB(cobj, target_rgb, *args, **kwargs):
             cobj.illuminant,
             target_illum,
         )
-        # Get the adjusted XYZ values, adapted for the target illuminant.
-        temp_X, temp_Y, temp_Z = apply_chromatic_adaptation(
-            temp_X, temp_Y, temp_Z, orig_illum=cobj.illuminant, targ_illum=target_illum
+        # The adaptation and the RGB working space matrix are applied as one
+        # combined matrix.
+        rgb_matrix = _get_adapted_xyz_to_rgb_matrix(target_rgb, cobj.illuminant)
+        rgb_r, rgb_g, rgb_b = numpy.dot(rgb_matrix, (temp_X, temp_Y, temp_Z))
+        # Clamp these values to a valid range, as apply_RGB_matrix() does.
+        rgb_r = max(rgb_r, 0.0)
+        rgb_g = max(rgb_g, 0.0)
+        rgb_b = max(rgb_b, 0.0)
+    else:
+        # Apply an RGB working space matrix to the XYZ values (matrix mul).
+        rgb_r, rgb_g, rgb_b = apply_RGB_matrix(
+            temp_X, temp_Y, temp_Z, rgb_type=target_rgb, convtype="xyz_to_rgb"
         )
-        logger.debug("  \\*   New values: %.3f, %.3f, %.3f", temp_X, temp_Y, temp_Z)
-
-    # Apply an RGB working space matrix to the XYZ values (matrix mul).
-    rgb_r, rgb_g, rgb_b = apply_RGB_matrix(
-        temp_X, temp_Y, temp_Z, rgb_type=target_rgb, convtype="xyz_to_rgb"
-    )
 
     # v
-    linear_channels = dict(r=rgb_r, g=rgb_g, b=rgb_b)
+    linear_channels = (rgb_r, rgb_g, rgb_b)
     # V
-    nonlinear_channels = {}
     if target_rgb == sRGBColor:
-        for channel in ["r", "g", "b"]:
-            v = linear_channels[channel]
-            if v <= 0.0031308:
-                nonlinear_channels[channel] = v * 12.92
-            else:
-                nonlinear_channels[channel] = 1.055 * math.pow(v, 1 / 2.4) - 0.055
+        nonlinear_channels = [_linear_to_srgb(v) for v in linear_channels]
     elif target_rgb == BT2020Color:
         if kwargs.get("is_12_bits_system"):
             a, b = 1.0993, 0.0181
         else:
             a, b = 1.099, 0.018
-        for channel in ["r", "g", "b"]:
-            v = linear_channels[channel]
-            if v < b:
-                nonlinear_channels[channel] = v * 4.5
-            else:
-                nonlinear_channels[channel] = a * math.pow(v, 0.45) - (a - 1)
+        nonlinear_channels = [
+            v * 4.5 if v < b else a * math.pow(v, 0.45) - (a - 1)
+            for v in linear_channels
+        ]
     else:
         # If it's not sRGB...
-        for channel in ["r", "g", "b"]:
-            v = linear_channels[channel]
-            nonlinear_channels[channel] = math.pow(v, 1 / target_rgb.rgb_gamma)
+        exponent = 1 / target_rgb.rgb_gamma
+        nonlinear_channels = [math.pow(v, exponent) for v in linear_channels]
 
-    return target_rgb(
-        nonlinear_channels["r"], nonlinear_channels["g"], nonlinear_channels["b"]
-    )
+    return target_rgb(*nonlinear_channels)
 
 
 # noinspection PyPep8Naming,PyUnusedLocal
@@ -571,56 +651,51 @@ def RGB_to_XYZ(cobj, target_illuminant=None, *args, **kwargs):
 
     Based off of: http://www.brucelindbloom.com/index.html?Eqn_RGB_to_XYZ.html
     """
-    # Will contain linearized RGB channels (removed the gamma func).
-    linear_channels = {}
-
+    # Linearize the RGB channels (remove the gamma func).
+    channels = (cobj.rgb_r, cobj.rgb_g, cobj.rgb_b)
     if isinstance(cobj, sRGBColor):
-        for channel in ["r", "g", "b"]:
-            V = getattr(cobj, "rgb_" + channel)
-            if V <= 0.04045:
-                linear_channels[channel] = V / 12.92
-            else:
-                linear_channels[channel] = math.pow((V + 0.055) / 1.055, 2.4)
+        linear_channels = [_srgb_to_linear(V) for V in channels]
     elif isinstance(cobj, BT2020Color):
         if kwargs.get("is_12_bits_system"):
             a, b, c = 1.0993, 0.0181, 0.081697877417347  # noqa
         else:
             a, b, c = 1.099, 0.018, 0.08124794403514049  # noqa
-        for channel in ["r", "g", "b"]:
-            V = getattr(cobj, "rgb_" + channel)
-            if V <= c:
-                linear_channels[channel] = V / 4.5
-            else:
-                linear_channels[channel] = math.pow((V + (a - 1)) / a, 1 / 0.45)
+        exponent = 1 / 0.45
+        linear_channels = [
+            V / 4.5 if V <= c else math.pow((V + (a - 1)) / a, exponent)
+            for V in channels
+        ]
     else:
         # If it's not sRGB...
         gamma = cobj.rgb_gamma
-
-        for channel in ["r", "g", "b"]:
-            V = getattr(cobj, "rgb_" + channel)
-            linear_channels[channel] = math.pow(V, gamma)
+        linear_channels = [math.pow(V, gamma) for V in channels]
 
     # Apply an RGB working space matrix to the XYZ values (matrix mul).
     xyz_x, xyz_y, xyz_z = apply_RGB_matrix(
-        linear_channels["r"],
-        linear_channels["g"],
-        linear_channels["b"],
+        linear_channels[0],
+        linear_channels[1],
+        linear_channels[2],
         rgb_type=cobj,
         convtype="rgb_to_xyz",
     )
 
-    if target_illuminant is None:
-        target_illuminant = cobj.native_illuminant
-
     # The illuminant of the original RGB object. This will always match
     # the RGB colorspace's native illuminant.
     illuminant = cobj.native_illuminant
-    xyzcolor = XYZColor(xyz_x, xyz_y, xyz_z, illuminant=illuminant)
-    # This will take care of any illuminant changes for us (if source
-    # illuminant != target illuminant).
-    xyzcolor.apply_adaptation(target_illuminant)
+    if target_illuminant is None:
+        target_illuminant = illuminant
+    else:
+        target_illuminant = target_illuminant.lower()
 
-    return xyzcolor
+    if target_illuminant != illuminant:
+        # Adapt the XYZ values to the target illuminant, as
+        # XYZColor.apply_adaptation() would, with the cached matrix.
+        adaptation_matrix = _get_adaptation_matrix(
+            illuminant, target_illuminant, "2", "bradford"
+        )
+        xyz_x, xyz_y, xyz_z = numpy.dot(adaptation_matrix, (xyz_x, xyz_y, xyz_z))
+
+    return XYZColor(xyz_x, xyz_y, xyz_z, illuminant=target_illuminant)
 
 
 # noinspection PyPep8Naming,PyUnusedLocal
@@ -855,13 +930,7 @@ def CMY_to_CMYK(cobj, *args, **kwargs):
 
     NOTE: CMYK and CMY values range from 0.0 to 1.0
     """
-    var_k = 1.0
-    if cobj.cmy_c < var_k:
-        var_k = cobj.cmy_c
-    if cobj.cmy_m < var_k:
-        var_k = cobj.cmy_m
-    if cobj.cmy_y < var_k:
-        var_k = cobj.cmy_y
+    var_k = min(1.0, cobj.cmy_c, cobj.cmy_m, cobj.cmy_y)
 
     if var_k == 1:
         cmyk_c = 0.0
@@ -914,6 +983,11 @@ def XYZ_to_IPT(cobj, *args, **kwargs):
     return IPTColor(*ipt_values)
 
 
+# The inverses of IPTColor's conversion matrices, for IPT_to_XYZ().
+_IPT_TO_LMS_MATRIX = numpy.linalg.inv(IPTColor.conversion_matrices["lms_to_ipt"])
+_LMS_TO_XYZ_MATRIX = numpy.linalg.inv(IPTColor.conversion_matrices["xyz_to_lms"])
+
+
 # noinspection PyPep8Naming,PyUnusedLocal
 @color_conversion_function(IPTColor, XYZColor)
 def IPT_to_XYZ(cobj, *args, **kwargs):
@@ -921,15 +995,11 @@ def IPT_to_XYZ(cobj, *args, **kwargs):
     Converts IPT to XYZ.
     """
     ipt_values = numpy.array(cobj.get_value_tuple())
-    lms_values = numpy.dot(
-        numpy.linalg.inv(IPTColor.conversion_matrices["lms_to_ipt"]), ipt_values
-    )
+    lms_values = numpy.dot(_IPT_TO_LMS_MATRIX, ipt_values)
 
     lms_prime = numpy.sign(lms_values) * numpy.abs(lms_values) ** (1 / 0.43)
 
-    xyz_values = numpy.dot(
-        numpy.linalg.inv(IPTColor.conversion_matrices["xyz_to_lms"]), lms_prime
-    )
+    xyz_values = numpy.dot(_LMS_TO_XYZ_MATRIX, lms_prime)
     return XYZColor(*xyz_values, observer="2", illuminant="d65")
 
 
@@ -985,8 +1055,12 @@ def convert_color(
 
     conversions = _conversion_manager.get_conversion_path(color.__class__, target_cs)
 
-    logger.debug("Converting %s to %s", color, target_cs)
-    logger.debug(" @ Conversion path: %s", conversions)
+    # Checked once up front so that the per-step logging below costs nothing
+    # when debug output is disabled.
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug("Converting %s to %s", color, target_cs)
+        logger.debug(" @ Conversion path: %s", conversions)
 
     # Start with original color in case we convert to the same color space.
     new_color = color
@@ -997,6 +1071,14 @@ def convert_color(
         # the expected RGB colorspace (instead of defaulting to sRGBColor).
         through_rgb_type = target_cs
 
+    if not conversions:
+        # The color is already in the target color space (e.g. Lab to Lab), so
+        # there is nothing to convert. Return it as is, like the loop below
+        # would, without the per-step bookkeeping.
+        if through_rgb_type != sRGBColor:
+            color._through_rgb_type = through_rgb_type
+        return color
+
     # We have to be careful to use the same RGB color space that created
     # an object (if it was created by a conversion) in order to get correct
     # results. For example, XYZ->HSL via Adobe RGB should default to Adobe
@@ -1022,23 +1104,25 @@ def convert_color(
     for func in conversions:
         # Execute the function in this conversion step and store the resulting
         # Color object.
-        logger.debug(
-            " * Conversion: %s passed to %s()", new_color.__class__.__name__, func
-        )
-        logger.debug(" |->  in %s", new_color)
-
-        if func:
-            # This can be None if you try to convert a color to the color
-            # space that is already in. IE: XYZ->XYZ.
-            new_color = func(
-                new_color,
-                target_rgb=target_rgb,
-                target_illuminant=target_illuminant,
-                *args,
-                **kwargs
+        if debug:
+            logger.debug(
+                " * Conversion: %s passed to %s()", new_color.__class__.__name__, func
             )
+            logger.debug(" |->  in %s", new_color)
+
+        # Paths from the conversion manager only hold conversion functions;
+        # converting to the same color space (IE: XYZ->XYZ) gives an empty
+        # path, which is handled above.
+        new_color = func(
+            new_color,
+            target_rgb=target_rgb,
+            target_illuminant=target_illuminant,
+            *args,
+            **kwargs
+        )
 
-        logger.debug(" |-< out %s", new_color)
+        if debug:
+            logger.debug(" |-< out %s", new_color)
 
     # If this conversion had something other than the default sRGB color space
     # requested,
@@ -0,0 +1,773 @@
+# -*- coding: utf-8 -*-
+"""
+This module contains the color space conversions from
+:py:mod:`colormath.color_conversions`, re-written to work on whole matrices of
+color values with NumPy instead of on one color object at a time. This is
+much faster when converting large volumes of colors, such as all of the
+pixels in an image.
+
+Each function takes a matrix whose last axis holds the values of a color, in
+the same order as the corresponding color object's constructor (an (N, 3)
+matrix, or an (H, W, 3) image), and returns a new matrix with the same leading
+dimensions. Colors have three values, except for CMYK colors, which have four,
+and spectral colors, which have 50. The results match the single-color
+conversions up to floating point rounding.
+
+Matrices of float32 values are converted in single precision, which is
+faster and takes half the memory, at the cost of accuracy. Anything else is
+converted in double precision.
+
+:py:func:`convert_color_matrix` chains these together like
+:py:func:`colormath.color_conversions.convert_color` does.
+"""
+
+import numpy
+
+from colormath import color_constants
+from colormath import color_conversions
+from colormath.chromatic_adaptation import _get_adaptation_matrix
+from colormath.color_conversions import (
+    _get_adapted_xyz_to_rgb_matrix,
+    _get_spectral_to_xyz_matrix,
+    _get_standard_spectral_to_xyz_matrix,
+)
+from colormath.color_exceptions import InvalidIlluminantError, UndefinedConversionError
+from colormath.color_objects import (
+    ColorBase,
+    BaseRGBColor,
+    sRGBColor,
+    BT2020Color,
+    SpectralColor,
+    _strip_rgb_hex,
+)
+
+
+def _get_illuminant_xyz(observer, illuminant):
+    """
+    Looks up the XYZ values of an illuminant's white point.
+
+    :param str observer: Observer angle. Either ``'2'`` or ``'10'``.
+    :param str illuminant: See :doc:`illuminants` for valid values.
+    :rtype: tuple
+    :raises: ValueError if `observer` is not recognized.
+    :raises: :py:exc:`colormath.color_exceptions.InvalidIlluminantError`
+        if `illuminant` is not recognized.
+    """
+    observer = str(observer)
+    if observer not in color_constants.OBSERVERS:
+        raise ValueError("Invalid observer angle specified: %s" % observer)
+    try:
+        return color_constants.ILLUMINANTS[observer][illuminant.lower()]
+    except (KeyError, AttributeError):
+        raise InvalidIlluminantError(illuminant)
+
+
+def _as_color_matrix(color_matrix, dtype=None, num_values=3):
+    """
+    Converts `color_matrix` to an array, making sure that its last axis
+    holds `num_values` values per color.
+
+    :param dtype: The type of the returned array. By default float32 arrays
+        are kept as they are, and anything else is converted to float64.
+    :param int num_values: The number of values of each color.
+    :rtype: numpy.ndarray
+    :raises: ValueError if `color_matrix` has the wrong shape.
+    """
+    color_matrix = numpy.asarray(color_matrix, dtype=dtype)
+    if dtype is None and color_matrix.dtype != numpy.float32:
+        color_matrix = color_matrix.astype(numpy.float64, copy=False)
+    if color_matrix.ndim < 2 or color_matrix.shape[-1] != num_values:
+        raise ValueError(
+            "Expected a matrix of color values with shape (N, %d), got shape %s."
+            % (num_values, color_matrix.shape)
+        )
+    return color_matrix
+
+
+def _split_matrix(color_matrix):
+    """
+    Splits a matrix of color values into its three channels.
+
+    :rtype: tuple
+    :returns: Three float arrays, each shaped like `color_matrix` without
+        its last axis.
+    """
+    color_matrix = _as_color_matrix(color_matrix)
+    return color_matrix[..., 0], color_matrix[..., 1], color_matrix[..., 2]
+
+
+def _stack_matrix(value_1, value_2, value_3):
+    """
+    The inverse of :py:func:`_split_matrix`.
+
+    :rtype: numpy.ndarray
+    """
+    return numpy.stack((value_1, value_2, value_3), axis=-1)
+
+
+def _apply_matrix(color_matrix, transform_matrix):
+    """
+    Multiplies every color in `color_matrix` by a 3x3 `transform_matrix`,
+    as ``numpy.dot(transform_matrix, color)`` does for a single color.
+
+    :rtype: numpy.ndarray
+    """
+    transform_matrix = transform_matrix.astype(color_matrix.dtype, copy=False)
+    return numpy.dot(color_matrix, transform_matrix.T)
+
+
+def _lab_f(t):
+    """
+    The forward non-linearity shared by the XYZ to Lab and Luv conversions.
+    """
+    result = 7.787 * t + 16.0 / 116.0
+    above = t > color_constants.CIE_E
+    result[above] = numpy.cbrt(t[above])
+    return result
+
+
+def _lab_f_inverse(f):
+    """
+    The inverse of :py:func:`_lab_f`, as used by the Lab to XYZ conversion.
+    """
+    cubed = f * f * f
+    return numpy.where(cubed > color_constants.CIE_E, cubed, (f - 16.0 / 116.0) / 7.787)
+
+
+def _lch_hue(y, x):
+    """
+    Calculates the hue angle of the LCH spaces in degrees, as the
+    single-color conversions do (angles of 0 are reported as 360).
+    """
+    hue = numpy.degrees(numpy.arctan2(y, x))
+    hue[hue <= 0] += 360
+    return hue
+
+
+# noinspection PyPep8Naming
+def Spectral_to_XYZ(
+    spectral_matrix, observer="2", illuminant="d50", illuminant_override=None
+):
+    """
+    Converts spectral readings to XYZ. All of the spectra are weighted with
+    the same matrix, so this is a single matrix multiplication.
+
+    :param numpy.ndarray spectral_matrix: An (N, 50) matrix of spectral
+        readings, one row per color, in the order of ``SpectralColor.VALUES``.
+    :param str observer: The observer angle of the readings.
+    :param str illuminant: The illuminant of the readings.
+    :param numpy.ndarray illuminant_override: A spectral power distribution
+        to use instead of the one for `illuminant`.
+    :rtype: numpy.ndarray
+    """
+    spectral_matrix = _as_color_matrix(
+        spectral_matrix, num_values=len(SpectralColor.VALUES)
+    )
+    observer = str(observer)
+    if observer not in color_constants.OBSERVERS:
+        raise ValueError("Invalid observer angle specified: %s" % observer)
+    if illuminant_override is not None:
+        weights = _get_spectral_to_xyz_matrix(observer, illuminant_override)
+    else:
+        weights = _get_standard_spectral_to_xyz_matrix(observer, illuminant.lower())
+    return _apply_matrix(spectral_matrix, weights)
+
+
+# noinspection PyPep8Naming
+def XYZ_to_Lab(xyz_matrix, observer="2", illuminant="d50"):
+    """
+    Converts XYZ to Lab.
+
+    :param numpy.ndarray xyz_matrix: The XYZ values.
+    :param str observer: The observer angle of the XYZ values.
+    :param str illuminant: The illuminant of the XYZ values.
+    :rtype: numpy.ndarray
+    """
+    xyz_x, xyz_y, xyz_z = _split_matrix(xyz_matrix)
+    illum_x, illum_y, illum_z = _get_illuminant_xyz(observer, illuminant)
+    temp_x = _lab_f(xyz_x / illum_x)
+    temp_y = _lab_f(xyz_y / illum_y)
+    temp_z = _lab_f(xyz_z / illum_z)
+
+    lab_l = 116.0 * temp_y - 16.0
+    lab_a = 500.0 * (temp_x - temp_y)
+    lab_b = 200.0 * (temp_y - temp_z)
+    return _stack_matrix(lab_l, lab_a, lab_b)
+
+
+# noinspection PyPep8Naming
+def Lab_to_XYZ(lab_matrix, observer="2", illuminant="d50"):
+    """
+    Converts Lab to XYZ.
+
+    :param numpy.ndarray lab_matrix: The Lab values.
+    :param str observer: The observer angle of the Lab values.
+    :param str illuminant: The illuminant of the Lab values.
+    :rtype: numpy.ndarray
+    """
+    lab_l, lab_a, lab_b = _split_matrix(lab_matrix)
+    illum_x, illum_y, illum_z = _get_illuminant_xyz(observer, illuminant)
+    xyz_y = (lab_l + 16.0) / 116.0
+    xyz_x = lab_a / 500.0 + xyz_y
+    xyz_z = xyz_y - lab_b / 200.0
+
+    xyz_x = illum_x * _lab_f_inverse(xyz_x)
+    xyz_y = illum_y * _lab_f_inverse(xyz_y)
+    xyz_z = illum_z * _lab_f_inverse(xyz_z)
+    return _stack_matrix(xyz_x, xyz_y, xyz_z)
+
+
+# noinspection PyPep8Naming
+def Lab_to_LCHab(lab_matrix):
+    """
+    Converts Lab to LCH(ab).
+
+    :param numpy.ndarray lab_matrix: The Lab values.
+    :rtype: numpy.ndarray
+    """
+    lab_l, lab_a, lab_b = _split_matrix(lab_matrix)
+    lch_c = numpy.sqrt(lab_a * lab_a + lab_b * lab_b)
+    return _stack_matrix(lab_l, lch_c, _lch_hue(lab_b, lab_a))
+
+
+# noinspection PyPep8Naming
+def LCHab_to_Lab(lch_matrix):
+    """
+    Converts LCH(ab) to Lab.
+
+    :param numpy.ndarray lch_matrix: The LCH(ab) values.
+    :rtype: numpy.ndarray
+    """
+    lch_l, lch_c, lch_h = _split_matrix(lch_matrix)
+    lch_h = numpy.radians(lch_h)
+    return _stack_matrix(lch_l, numpy.cos(lch_h) * lch_c, numpy.sin(lch_h) * lch_c)
+
+
+# noinspection PyPep8Naming
+def XYZ_to_Luv(xyz_matrix, observer="2", illuminant="d50"):
+    """
+    Converts XYZ to Luv.
+
+    :param numpy.ndarray xyz_matrix: The XYZ values.
+    :param str observer: The observer angle of the XYZ values.
+    :param str illuminant: The illuminant of the XYZ values.
+    :rtype: numpy.ndarray
+    """
+    xyz_x, xyz_y, xyz_z = _split_matrix(xyz_matrix)
+    illum_x, illum_y, illum_z = _get_illuminant_xyz(observer, illuminant)
+
+    denom = xyz_x + 15.0 * xyz_y + 3.0 * xyz_z
+    # Avoid division by zero: black has u' and v' of 0.
+    is_black = denom == 0.0
+    denom[is_black] = 1.0
+    luv_u = 4.0 * xyz_x / denom
+    luv_v = 9.0 * xyz_y / denom
+    luv_u[is_black] = 0.0
+    luv_v[is_black] = 0.0
+
+    illum_denom = illum_x + 15.0 * illum_y + 3.0 * illum_z
+    ref_U = 4.0 * illum_x / illum_denom
+    ref_V = 9.0 * illum_y / illum_denom
+
+    luv_l = 116.0 * _lab_f(xyz_y / illum_y) - 16.0
+    luv_u = 13.0 * luv_l * (luv_u - ref_U)
+    luv_v = 13.0 * luv_l * (luv_v - ref_V)
+    return _stack_matrix(luv_l, luv_u, luv_v)
+
+
+# noinspection PyPep8Naming
+def Luv_to_XYZ(luv_matrix, observer="2", illuminant="d50"):
+    """
+    Converts Luv to XYZ.
+
+    :param numpy.ndarray luv_matrix: The Luv values.
+    :param str observer: The observer angle of the Luv values.
+    :param str illuminant: The illuminant of the Luv values.
+    :rtype: numpy.ndarray
+    """
+    luv_l, luv_u, luv_v = _split_matrix(luv_matrix)
+    illum_x, illum_y, illum_z = _get_illuminant_xyz(observer, illuminant)
+
+    # Without light, there is no color. These are zeroed out at the end, and
+    # use a dummy lightness until then to avoid zero divisions.
+    is_black = luv_l <= 0.0
+    luv_l = numpy.where(is_black, 1.0, luv_l)
+
+    illum_denom = illum_x + 15.0 * illum_y + 3.0 * illum_z
+    u_sub_0 = 4.0 * illum_x / illum_denom
+    v_sub_0 = 9.0 * illum_y / illum_denom
+    var_u = luv_u / (13.0 * luv_l) + u_sub_0
+    var_v = luv_v / (13.0 * luv_l) + v_sub_0
+
+    cie_k_times_e = color_constants.CIE_K * color_constants.CIE_E
+    xyz_y = luv_l / color_constants.CIE_K
+    above = luv_l > cie_k_times_e
+    xyz_y[above] = ((luv_l[above] + 16.0) / 116.0) ** 3
+
+    xyz_x = xyz_y * 9.0 * var_u / (4.0 * var_v)
+    xyz_z = xyz_y * (12.0 - 3.0 * var_u - 20.0 * var_v) / (4.0 * var_v)
+
+    xyz_matrix = _stack_matrix(xyz_x, xyz_y, xyz_z)
+    xyz_matrix[is_black] = 0.0
+    return xyz_matrix
+
+
+# noinspection PyPep8Naming
+def Luv_to_LCHuv(luv_matrix):
+    """
+    Converts Luv to LCH(uv).
+
+    :param numpy.ndarray luv_matrix: The Luv values.
+    :rtype: numpy.ndarray
+    """
+    luv_l, luv_u, luv_v = _split_matrix(luv_matrix)
+    lch_c = numpy.sqrt(luv_u * luv_u + luv_v * luv_v)
+    return _stack_matrix(luv_l, lch_c, _lch_hue(luv_v, luv_u))
+
+
+# noinspection PyPep8Naming
+def LCHuv_to_Luv(lch_matrix):
+    """
+    Converts LCH(uv) to Luv.
+
+    :param numpy.ndarray lch_matrix: The LCH(uv) values.
+    :rtype: numpy.ndarray
+    """
+    return LCHab_to_Lab(lch_matrix)
+
+
+# noinspection PyPep8Naming
+def XYZ_to_xyY(xyz_matrix):
+    """
+    Converts XYZ to xyY.
+
+    :param numpy.ndarray xyz_matrix: The XYZ values.
+    :rtype: numpy.ndarray
+    """
+    xyz_x, xyz_y, xyz_z = _split_matrix(xyz_matrix)
+    xyz_sum = xyz_x + xyz_y + xyz_z
+    # Avoid division by zero: black has x and y of 0.
+    is_black = xyz_sum == 0.0
+    xyz_sum[is_black] = 1.0
+    xyy_x = xyz_x / xyz_sum
+    xyy_y = xyz_y / xyz_sum
+    xyy_x[is_black] = 0.0
+    xyy_y[is_black] = 0.0
+    return _stack_matrix(xyy_x, xyy_y, xyz_y)
+
+
+# noinspection PyPep8Naming
+def xyY_to_XYZ(xyy_matrix):
+    """
+    Converts xyY to XYZ.
+
+    :param numpy.ndarray xyy_matrix: The xyY values.
+    :rtype: numpy.ndarray
+    """
+    xyy_x, xyy_y, xyy_Y = _split_matrix(xyy_matrix)
+    # Avoid division by zero: a y of 0 is black.
+    is_black = xyy_y == 0.0
+    xyy_y = numpy.where(is_black, 1.0, xyy_y)
+    xyz_x = xyy_x * xyy_Y / xyy_y
+    xyz_z = (1.0 - xyy_x - xyy_y) * xyy_Y / xyy_y
+
+    xyz_matrix = _stack_matrix(xyz_x, xyy_Y, xyz_z)
+    xyz_matrix[is_black] = 0.0
+    return xyz_matrix
+
+
+def _linearize_rgb(rgb_matrix, rgb_type, is_12_bits_system):
+    """
+    Removes the gamma func of `rgb_type` from a float RGB matrix. Only the
+    values past the linear segment go through the (slow) power function.
+
+    :rtype: numpy.ndarray
+    """
+    if issubclass(rgb_type, sRGBColor):
+        linear = rgb_matrix / 12.92
+        curved = rgb_matrix > 0.04045
+        linear[curved] = ((rgb_matrix[curved] + 0.055) / 1.055) ** 2.4
+    elif issubclass(rgb_type, BT2020Color):
+        if is_12_bits_system:
+            a, c = 1.0993, 0.081697877417347
+        else:
+            a, c = 1.099, 0.08124794403514049
+        linear = rgb_matrix / 4.5
+        curved = rgb_matrix > c
+        linear[curved] = ((rgb_matrix[curved] + (a - 1)) / a) ** (1 / 0.45)
+    else:
+        linear = rgb_matrix**rgb_type.rgb_gamma
+    return linear
+
+
+# Linearized values of all 256 8-bit channel values, keyed by
+# (rgb_type, is_12_bits_system). See _get_uint8_linearization_table().
+_UINT8_LINEARIZATION_TABLES = {}
+
+
+def _get_uint8_linearization_table(rgb_type, is_12_bits_system):
+    """
+    Returns the linearized value of every 8-bit channel value of `rgb_type`,
+    computed with :py:func:`_linearize_rgb` the first time it is asked for.
+
+    :rtype: numpy.ndarray
+    """
+    key = (rgb_type, is_12_bits_system)
+    try:
+        return _UINT8_LINEARIZATION_TABLES[key]
+    except KeyError:
+        pass
+
+    table = _linearize_rgb(numpy.arange(256) / 255.0, rgb_type, is_12_bits_system)
+    table.setflags(write=False)
+    _UINT8_LINEARIZATION_TABLES[key] = table
+    return table
+
+
+def _rgb_as_float(rgb_matrix):
+    """
+    Converts an RGB matrix to floats between 0 and 1, scaling down 8-bit
+    (uint8) values from 0-255.
+
+    :rtype: numpy.ndarray
+    """
+    rgb_matrix = numpy.asarray(rgb_matrix)
+    if rgb_matrix.dtype == numpy.uint8:
+        return _as_color_matrix(rgb_matrix) / 255.0
+    return _as_color_matrix(rgb_matrix)
+
+
+# noinspection PyPep8Naming
+def apply_chromatic_adaptation(
+    xyz_matrix, orig_illum, targ_illum, observer="2", adaptation="bradford"
+):
+    """
+    Adapts XYZ values from one illuminant to another, as
+    :py:func:`colormath.chromatic_adaptation.apply_chromatic_adaptation` does
+    for a single color. The adaptation matrix is calculated once and applied
+    to all of the colors with a single multiplication.
+
+    :param numpy.ndarray xyz_matrix: The XYZ values.
+    :param orig_illum: The illuminant of the XYZ values, either by name or
+        as the XYZ values of its white point.
+    :param targ_illum: The illuminant to adapt to, in the same forms.
+    :param str observer: Observer angle. Either ``'2'`` or ``'10'``.
+    :param str adaptation: See
+        :py:data:`colormath.color_constants.ADAPTATION_MATRICES` for valid
+        values.
+    :rtype: numpy.ndarray
+    """
+    if isinstance(orig_illum, str):
+        orig_illum = _get_illuminant_xyz(observer, orig_illum)
+    if isinstance(targ_illum, str):
+        targ_illum = _get_illuminant_xyz(observer, targ_illum)
+    adaptation_matrix = _get_adaptation_matrix(
+        orig_illum, targ_illum, str(observer), adaptation.lower()
+    )
+    return _apply_matrix(_as_color_matrix(xyz_matrix), adaptation_matrix)
+
+
+# noinspection PyPep8Naming
+def RGB_to_XYZ(rgb_matrix, rgb_type, target_illuminant=None, is_12_bits_system=False):
+    """
+    Converts RGB to XYZ.
+
+    :param numpy.ndarray rgb_matrix: The RGB values, between 0 and 1. A uint8
+        matrix is taken to hold 8-bit values between 0 and 255, as read from
+        most images. These are linearized with a lookup table rather than
+        the power function, as there are only 256 possible values.
+    :param rgb_type: The RGB color space of the values, as a
+        :py:class:`colormath.color_objects.BaseRGBColor` subclass.
+    :param str target_illuminant: The illuminant of the resulting XYZ values.
+        Defaults to the native illuminant of `rgb_type`.
+    :param bool is_12_bits_system: For BT2020Color only, whether the values
+        are from a 12-bit system rather than a 10-bit one.
+    :rtype: numpy.ndarray
+    """
+    rgb_matrix = numpy.asarray(rgb_matrix)
+    if rgb_matrix.dtype == numpy.uint8:
+        table = _get_uint8_linearization_table(rgb_type, is_12_bits_system)
+        linear = table[_as_color_matrix(rgb_matrix, dtype=numpy.uint8)]
+    else:
+        linear = _linearize_rgb(
+            _as_color_matrix(rgb_matrix), rgb_type, is_12_bits_system
+        )
+
+    xyz_matrix = _apply_matrix(linear, rgb_type.conversion_matrices["rgb_to_xyz"])
+    # Clamp these values to a valid range, as apply_RGB_matrix() does.
+    numpy.maximum(xyz_matrix, 0.0, out=xyz_matrix)
+
+    native_illuminant = rgb_type.native_illuminant
+    if target_illuminant is not None:
+        target_illuminant = target_illuminant.lower()
+        if target_illuminant != native_illuminant:
+            adaptation_matrix = _get_adaptation_matrix(
+                native_illuminant, target_illuminant, "2", "bradford"
+            )
+            xyz_matrix = _apply_matrix(xyz_matrix, adaptation_matrix)
+    return xyz_matrix
+
+
+# noinspection PyPep8Naming
+def XYZ_to_RGB(xyz_matrix, target_rgb, illuminant="d50", is_12_bits_system=False):
+    """
+    Converts XYZ to RGB.
+
+    :param numpy.ndarray xyz_matrix: The XYZ values.
+    :param target_rgb: The RGB color space to convert to, as a
+        :py:class:`colormath.color_objects.BaseRGBColor` subclass.
+    :param str illuminant: The illuminant of the XYZ values. They are adapted
+        to the native illuminant of `target_rgb` if it differs.
+    :param bool is_12_bits_system: For BT2020Color only, whether to convert
+        for a 12-bit system rather than a 10-bit one.
+    :rtype: numpy.ndarray
+    :returns: The RGB values, between 0 and 1.
+    """
+    xyz_matrix = _as_color_matrix(xyz_matrix)
+    illuminant = illuminant.lower()
+    if illuminant != target_rgb.native_illuminant:
+        rgb_matrix = _get_adapted_xyz_to_rgb_matrix(target_rgb, illuminant)
+    else:
+        rgb_matrix = target_rgb.conversion_matrices["xyz_to_rgb"]
+    linear = _apply_matrix(xyz_matrix, rgb_matrix)
+    # Clamp these values to a valid range, as apply_RGB_matrix() does.
+    numpy.maximum(linear, 0.0, out=linear)
+
+    # Apply the gamma func. Only the values past the linear segment go
+    # through the (slow) power function.
+    if target_rgb == sRGBColor:
+        nonlinear = linear * 12.92
+        curved = linear > 0.0031308
+        nonlinear[curved] = 1.055 * linear[curved] ** (1 / 2.4) - 0.055
+    elif target_rgb == BT2020Color:
+        if is_12_bits_system:
+            a, b = 1.0993, 0.0181
+        else:
+            a, b = 1.099, 0.018
+        nonlinear = linear * 4.5
+        curved = linear >= b
+        nonlinear[curved] = a * linear[curved] ** 0.45 - (a - 1)
+    else:
+        nonlinear = linear ** (1 / target_rgb.rgb_gamma)
+    return nonlinear
+
+
+# noinspection PyPep8Naming
+def RGB_to_CMY(rgb_matrix):
+    """
+    Converts RGB to CMY.
+
+    :param numpy.ndarray rgb_matrix: The RGB values, between 0 and 1, or
+        between 0 and 255 for a uint8 matrix.
+    :rtype: numpy.ndarray
+    """
+    return 1.0 - _rgb_as_float(rgb_matrix)
+
+
+# noinspection PyPep8Naming
+def CMY_to_RGB(cmy_matrix):
+    """
+    Converts CMY to RGB.
+
+    :param numpy.ndarray cmy_matrix: The CMY values, between 0 and 1.
+    :rtype: numpy.ndarray
+    """
+    return 1.0 - _as_color_matrix(cmy_matrix)
+
+
+# noinspection PyPep8Naming
+def RGB_to_hex(rgb_matrix):
+    """
+    Converts RGB values to hex strings in the form of #RRGGBB, as
+    :py:meth:`colormath.color_objects.BaseRGBColor.get_rgb_hex` does.
+
+    :param numpy.ndarray rgb_matrix: An (N, 3) matrix of RGB values, between
+        0 and 1, or between 0 and 255 for a uint8 matrix. Out of gamut values
+        are clamped.
+    :rtype: list
+    :returns: N hex strings.
+    :raises: ValueError if any of the values is NaN.
+    """
+    rgb_matrix = numpy.asarray(rgb_matrix)
+    if rgb_matrix.dtype == numpy.uint8:
+        upscaled = _as_color_matrix(rgb_matrix, dtype=numpy.uint8).reshape(-1, 3)
+    else:
+        rgb_matrix = _as_color_matrix(rgb_matrix).reshape(-1, 3)
+        # Infinite values are clamped like any other out of gamut value, but
+        # NaN has no hex value, and get_rgb_hex() raises ValueError for it.
+        if numpy.isnan(rgb_matrix).any():
+            raise ValueError("Cannot convert NaN RGB values to hex.")
+        clamped = numpy.clip(rgb_matrix, 0.0, 1.0)
+        upscaled = numpy.floor(0.5 + clamped * 255)
+    # Pack each color into one integer, so that each string is formatted
+    # with a single substitution.
+    packed = upscaled.astype(numpy.int64)
+    packed = (packed[:, 0] << 16) | (packed[:, 1] << 8) | packed[:, 2]
+    return ["#%06x" % value for value in packed.tolist()]
+
+
+# noinspection PyPep8Naming
+def hex_to_RGB(hex_strings):
+    """
+    Converts hex strings in the form of #RRGGBB to RGB values, as
+    :py:meth:`colormath.color_objects.BaseRGBColor.new_from_rgb_hex` does.
+
+    :param hex_strings: A sequence of N hex strings.
+    :rtype: numpy.ndarray
+    :returns: An (N, 3) matrix of RGB values between 0 and 1.
+    :raises: ValueError if a string is not in #RRGGBB format.
+    """
+    # Validate each string, then parse them all with a single call.
+    digits = "".join([_strip_rgb_hex(hex_str) for hex_str in hex_strings])
+    upscaled = numpy.frombuffer(bytearray.fromhex(digits), dtype=numpy.uint8)
+    return upscaled.reshape(-1, 3) / 255.0
+
+
+# noinspection PyPep8Naming
+def CMY_to_CMYK(cmy_matrix):
+    """
+    Converts CMY to CMYK.
+
+    :param numpy.ndarray cmy_matrix: The CMY values, between 0 and 1.
+    :rtype: numpy.ndarray
+    :returns: An (N, 4) matrix of CMYK values.
+    """
+    cmy_matrix = _as_color_matrix(cmy_matrix)
+    cmyk_k = numpy.minimum(cmy_matrix.min(axis=-1), 1.0)
+    # Pure black has no C, M or Y. Use a dummy divisor for it to avoid a
+    # zero division, then zero out the results.
+    is_black = cmyk_k == 1.0
+    denom = numpy.where(is_black, 1.0, 1.0 - cmyk_k)[..., numpy.newaxis]
+    cmyk_matrix = numpy.empty(cmy_matrix.shape[:-1] + (4,), dtype=cmy_matrix.dtype)
+    numpy.subtract(cmy_matrix, cmyk_k[..., numpy.newaxis], out=cmyk_matrix[..., :3])
+    cmyk_matrix[..., :3] /= denom
+    cmyk_matrix[is_black, :3] = 0.0
+    cmyk_matrix[..., 3] = cmyk_k
+    return cmyk_matrix
+
+
+# noinspection PyPep8Naming
+def CMYK_to_CMY(cmyk_matrix):
+    """
+    Converts CMYK to CMY.
+
+    :param numpy.ndarray cmyk_matrix: An (N, 4) matrix of CMYK values,
+        between 0 and 1.
+    :rtype: numpy.ndarray
+    """
+    cmyk_matrix = _as_color_matrix(cmyk_matrix, num_values=4)
+    cmyk_k = cmyk_matrix[..., 3:]
+    return cmyk_matrix[..., :3] * (1.0 - cmyk_k) + cmyk_k
+
+
+# The matrix version of each single-color conversion function that has one,
+# and whether it needs the observer and illuminant of the values. The RGB
+# <-> XYZ conversions are handled separately by convert_color_matrix().
+_MATRIX_CONVERSIONS = {
+    color_conversions.Spectral_to_XYZ: (Spectral_to_XYZ, True),
+    color_conversions.XYZ_to_Lab: (XYZ_to_Lab, True),
+    color_conversions.Lab_to_XYZ: (Lab_to_XYZ, True),
+    color_conversions.XYZ_to_Luv: (XYZ_to_Luv, True),
+    color_conversions.Luv_to_XYZ: (Luv_to_XYZ, True),
+    color_conversions.Lab_to_LCHab: (Lab_to_LCHab, False),
+    color_conversions.LCHab_to_Lab: (LCHab_to_Lab, False),
+    color_conversions.Luv_to_LCHuv: (Luv_to_LCHuv, False),
+    color_conversions.LCHuv_to_Luv: (LCHuv_to_Luv, False),
+    color_conversions.XYZ_to_xyY: (XYZ_to_xyY, False),
+    color_conversions.xyY_to_XYZ: (xyY_to_XYZ, False),
+    color_conversions.RGB_to_CMY: (RGB_to_CMY, False),
+    color_conversions.CMY_to_RGB: (CMY_to_RGB, False),
+    color_conversions.CMY_to_CMYK: (CMY_to_CMYK, False),
+    color_conversions.CMYK_to_CMY: (CMYK_to_CMY, False),
+}
+
+
+def convert_color_matrix(
+    color_matrix,
+    start_cs,
+    target_cs,
+    through_rgb_type=sRGBColor,
+    target_illuminant=None,
+    observer="2",
+    illuminant="d50",
+    is_12_bits_system=False,
+):
+    """
+    Converts a whole matrix of colors from one color space to another. This
+    follows the same conversion path as
+    :py:func:`colormath.color_conversions.convert_color`, using the matrix
+    versions of the conversions in this module.
+
+    :param numpy.ndarray color_matrix: The values of the colors to convert.
+        For an RGB `start_cs`, a uint8 matrix holds 8-bit values between 0
+        and 255 (see :py:func:`RGB_to_XYZ`).
+    :param start_cs: The Color class of the values in `color_matrix`.
+    :param target_cs: The Color class to convert to.
+    :keyword BaseRGBColor through_rgb_type: The RGB color space to use if
+        the conversion passes through RGB.
+    :keyword str target_illuminant: The illuminant to end up with when
+        converting from RGB to a reflective color space. Defaults to the RGB
+        space's native illuminant.
+    :keyword str observer: The observer angle of the values in
+        `color_matrix`, if `start_cs` has one.
+    :keyword str illuminant: The illuminant of the values in
+        `color_matrix`, if `start_cs` has one.
+    :keyword bool is_12_bits_system: Passed on to the BT2020Color conversions.
+    :rtype: numpy.ndarray
+    :returns: The converted values, in the order of ``target_cs.VALUES``.
+    :raises: :py:exc:`colormath.color_exceptions.UndefinedConversionError`
+        if there is no conversion path between the two color spaces, or
+        some step along it has no matrix version.
+    """
+    if not issubclass(start_cs, ColorBase) or not issubclass(target_cs, ColorBase):
+        raise ValueError("start_cs and target_cs must be Color classes.")
+
+    conversions = color_conversions._conversion_manager.get_conversion_path(
+        start_cs, target_cs
+    )
+    color_matrix = numpy.asarray(color_matrix)
+    if not conversions:
+        return _as_color_matrix(
+            color_matrix, dtype=color_matrix.dtype, num_values=len(start_cs.VALUES)
+        ).copy()
+
+    if issubclass(target_cs, BaseRGBColor):
+        # As in convert_color(), RGB targets are reached through themselves.
+        through_rgb_type = target_cs
+    if issubclass(start_cs, BaseRGBColor):
+        rgb_type = start_cs
+    else:
+        rgb_type = through_rgb_type
+
+    for func in conversions:
+        if func is color_conversions.XYZ_to_RGB:
+            rgb_type = through_rgb_type
+            color_matrix = XYZ_to_RGB(
+                color_matrix,
+                rgb_type,
+                illuminant=illuminant,
+                is_12_bits_system=is_12_bits_system,
+            )
+        elif func is color_conversions.RGB_to_XYZ:
+            color_matrix = RGB_to_XYZ(
+                color_matrix,
+                rgb_type,
+                target_illuminant=target_illuminant,
+                is_12_bits_system=is_12_bits_system,
+            )
+            # Like the XYZColor that RGB_to_XYZ() returns.
+            observer = "2"
+            if target_illuminant is None:
+                illuminant = rgb_type.native_illuminant
+            else:
+                illuminant = target_illuminant.lower()
+        else:
+            try:
+                matrix_func, uses_illuminant = _MATRIX_CONVERSIONS[func]
+            except KeyError:
+                raise UndefinedConversionError(start_cs.__name__, target_cs.__name__)
+            if uses_illuminant:
+                color_matrix = matrix_func(color_matrix, observer, illuminant)
+            else:
+                color_matrix = matrix_func(color_matrix)
+    return color_matrix
@@ -4,37 +4,53 @@ The functions in this module are used for comparing two LabColor objects
 using various Delta E formulas.
 """
 
+import math
+
 import numpy
 
 from colormath import color_diff_matrix
+from colormath.color_objects import LabColor
+
+_POW_25_7 = 25.0**7
 
 
-def _get_lab_color1_vector(color):
+def _check_lab_color(color):
     """
-    Converts an LabColor into a NumPy vector.
+    Makes sure that we've been handed a LabColor.
 
     :param LabColor color:
-    :rtype: numpy.ndarray
+    :raises: ValueError if ``color`` is not a LabColor.
     """
-    if not color.__class__.__name__ == "LabColor":
+    if not isinstance(color, LabColor):
         raise ValueError(
             "Delta E functions can only be used with two LabColor objects."
         )
-    return numpy.array([color.lab_l, color.lab_a, color.lab_b])
 
 
-def _get_lab_color2_matrix(color):
+# noinspection PyPep8Naming
+def _delta_lch(color1, color2):
     """
-    Converts an LabColor into a NumPy matrix.
+    Calculates the lightness, chroma and hue differences shared by the
+    CIE1994 and CMC formulas.
 
-    :param LabColor color:
-    :rtype: numpy.ndarray
+    :param LabColor color1: The reference color.
+    :param LabColor color2: The sample color.
+    :rtype: tuple
+    :returns: The chroma of `color1`, then delta L, delta C and delta H.
     """
-    if not color.__class__.__name__ == "LabColor":
-        raise ValueError(
-            "Delta E functions can only be used with two LabColor objects."
-        )
-    return numpy.array([(color.lab_l, color.lab_a, color.lab_b)])
+    a_1, b_1 = color1.lab_a, color1.lab_b
+    a_2, b_2 = color2.lab_a, color2.lab_b
+    C_1 = math.sqrt(a_1 * a_1 + b_1 * b_1)
+    C_2 = math.sqrt(a_2 * a_2 + b_2 * b_2)
+
+    delta_L = color1.lab_l - color2.lab_l
+    delta_C = C_1 - C_2
+    delta_a = a_1 - a_2
+    delta_b = b_1 - b_2
+    delta_H_sq = delta_a * delta_a + delta_b * delta_b - delta_C * delta_C
+    delta_H = math.sqrt(max(delta_H_sq, 0))
+
+    return C_1, delta_L, delta_C, delta_H
 
 
 # noinspection PyPep8Naming
@@ -42,10 +58,14 @@ def delta_e_cie1976(color1, color2):
     """
     Calculates the Delta E (CIE1976) of two colors.
     """
-    color1_vector = _get_lab_color1_vector(color1)
-    color2_matrix = _get_lab_color2_matrix(color2)
-    delta_e = color_diff_matrix.delta_e_cie1976(color1_vector, color2_matrix)[0]
-    return delta_e.item()
+    _check_lab_color(color1)
+    _check_lab_color(color2)
+    # This is a plain Euclidean distance, which is cheaper to compute
+    # directly than to route through the NumPy matrix kernel.
+    delta_L = color1.lab_l - color2.lab_l
+    delta_a = color1.lab_a - color2.lab_a
+    delta_b = color1.lab_b - color2.lab_b
+    return math.sqrt(delta_L * delta_L + delta_a * delta_a + delta_b * delta_b)
 
 
 # noinspection PyPep8Naming
@@ -63,12 +83,20 @@ def delta_e_cie1994(color1, color2, K_L=1, K_C=1, K_H=1, K_1=0.045, K_2=0.015):
       1 default
       2 textiles
     """
-    color1_vector = _get_lab_color1_vector(color1)
-    color2_matrix = _get_lab_color2_matrix(color2)
-    delta_e = color_diff_matrix.delta_e_cie1994(
-        color1_vector, color2_matrix, K_L=K_L, K_C=K_C, K_H=K_H, K_1=K_1, K_2=K_2
-    )[0]
-    return delta_e.item()
+    _check_lab_color(color1)
+    _check_lab_color(color2)
+    # Like delta_e_cie2000 below, this mirrors the matrix kernel with plain
+    # floats to avoid the NumPy overhead for a single pair of colors.
+    C_1, delta_L, delta_C, delta_H = _delta_lch(color1, color2)
+
+    S_L = 1
+    S_C = 1 + K_1 * C_1
+    S_H = 1 + K_2 * C_1
+
+    L_term = delta_L / (K_L * S_L)
+    C_term = delta_C / (K_C * S_C)
+    H_term = delta_H / (K_H * S_H)
+    return math.sqrt(L_term * L_term + C_term * C_term + H_term * H_term)
 
 
 # noinspection PyPep8Naming
@@ -76,12 +104,81 @@ def delta_e_cie2000(color1, color2, Kl=1, Kc=1, Kh=1):
     """
     Calculates the Delta E (CIE2000) of two colors.
     """
-    color1_vector = _get_lab_color1_vector(color1)
-    color2_matrix = _get_lab_color2_matrix(color2)
-    delta_e = color_diff_matrix.delta_e_cie2000(
-        color1_vector, color2_matrix, Kl=Kl, Kc=Kc, Kh=Kh
-    )[0]
-    return delta_e.item()
+    _check_lab_color(color1)
+    _check_lab_color(color2)
+    # This mirrors color_diff_matrix.delta_e_cie2000 using plain floats. For
+    # a single pair of colors the per-call overhead of the NumPy ufuncs is far
+    # larger than the math itself.
+    L1, a1, b1 = color1.lab_l, color1.lab_a, color1.lab_b
+    L2, a2, b2 = color2.lab_l, color2.lab_a, color2.lab_b
+
+    avg_Lp = (L1 + L2) / 2.0
+
+    C1 = math.sqrt(a1 * a1 + b1 * b1)
+    C2 = math.sqrt(a2 * a2 + b2 * b2)
+
+    avg_C1_C2 = (C1 + C2) / 2.0
+    avg_C1_C2_pow_7 = avg_C1_C2 * avg_C1_C2 * avg_C1_C2
+    avg_C1_C2_pow_7 *= avg_C1_C2_pow_7 * avg_C1_C2
+    G = 0.5 * (1 - math.sqrt(avg_C1_C2_pow_7 / (avg_C1_C2_pow_7 + _POW_25_7)))
+
+    a1p = (1.0 + G) * a1
+    a2p = (1.0 + G) * a2
+
+    C1p = math.sqrt(a1p * a1p + b1 * b1)
+    C2p = math.sqrt(a2p * a2p + b2 * b2)
+
+    avg_C1p_C2p = (C1p + C2p) / 2.0
+
+    h1p = math.degrees(math.atan2(b1, a1p))
+    if h1p < 0:
+        h1p += 360
+
+    h2p = math.degrees(math.atan2(b2, a2p))
+    if h2p < 0:
+        h2p += 360
+
+    diff_h2p_h1p = h2p - h1p
+    if math.fabs(diff_h2p_h1p) > 180:
+        avg_Hp = (h1p + h2p + 360.0) / 2.0
+        if h2p > h1p:
+            delta_hp = diff_h2p_h1p - 360.0
+        else:
+            delta_hp = diff_h2p_h1p + 360.0
+    else:
+        avg_Hp = (h1p + h2p) / 2.0
+        delta_hp = diff_h2p_h1p
+
+    T = (
+        1
+        - 0.17 * math.cos(math.radians(avg_Hp - 30))
+        + 0.24 * math.cos(math.radians(2 * avg_Hp))
+        + 0.32 * math.cos(math.radians(3 * avg_Hp + 6))
+        - 0.2 * math.cos(math.radians(4 * avg_Hp - 63))
+    )
+
+    delta_Lp = L2 - L1
+    delta_Cp = C2p - C1p
+    delta_Hp = 2 * math.sqrt(C2p * C1p) * math.sin(math.radians(delta_hp) / 2.0)
+
+    avg_Lp_sq = (avg_Lp - 50) * (avg_Lp - 50)
+    S_L = 1 + (0.015 * avg_Lp_sq) / math.sqrt(20 + avg_Lp_sq)
+    S_C = 1 + 0.045 * avg_C1p_C2p
+    S_H = 1 + 0.015 * avg_C1p_C2p * T
+
+    delta_ro = (avg_Hp - 275) / 25
+    delta_ro = 30 * math.exp(-(delta_ro * delta_ro))
+    avg_C1p_C2p_pow_7 = avg_C1p_C2p * avg_C1p_C2p * avg_C1p_C2p
+    avg_C1p_C2p_pow_7 *= avg_C1p_C2p_pow_7 * avg_C1p_C2p
+    R_C = math.sqrt(avg_C1p_C2p_pow_7 / (avg_C1p_C2p_pow_7 + _POW_25_7))
+    R_T = -2 * R_C * math.sin(2 * math.radians(delta_ro))
+
+    L_term = delta_Lp / (S_L * Kl)
+    C_term = delta_Cp / (S_C * Kc)
+    H_term = delta_Hp / (S_H * Kh)
+    return math.sqrt(
+        L_term * L_term + C_term * C_term + H_term * H_term + R_T * C_term * H_term
+    )
 
 
 # noinspection PyPep8Naming
@@ -93,9 +190,91 @@ def delta_e_cmc(color1, color2, pl=2, pc=1):
       Acceptability: pl=2, pc=1
       Perceptability: pl=1, pc=1
     """
-    color1_vector = _get_lab_color1_vector(color1)
-    color2_matrix = _get_lab_color2_matrix(color2)
-    delta_e = color_diff_matrix.delta_e_cmc(color1_vector, color2_matrix, pl=pl, pc=pc)[
-        0
-    ]
-    return delta_e.item()
+    _check_lab_color(color1)
+    _check_lab_color(color2)
+    C_1, delta_L, delta_C, delta_H = _delta_lch(color1, color2)
+
+    L, a, b = color1.lab_l, color1.lab_a, color1.lab_b
+    H = math.degrees(math.atan2(b, a)) % 360
+
+    C_pow_4 = C_1 * C_1
+    C_pow_4 *= C_pow_4
+    F = math.sqrt(C_pow_4 / (C_pow_4 + 1900.0))
+
+    if 164 <= H <= 345:
+        T = 0.56 + abs(0.2 * math.cos(math.radians(H + 168)))
+    else:
+        T = 0.36 + abs(0.4 * math.cos(math.radians(H + 35)))
+
+    if L < 16:
+        S_L = 0.511
+    else:
+        S_L = (0.040975 * L) / (1 + 0.01765 * L)
+    S_C = ((0.0638 * C_1) / (1 + 0.0131 * C_1)) + 0.638
+    S_H = S_C * (F * T + 1 - F)
+
+    L_term = delta_L / (pl * S_L)
+    C_term = delta_C / (pc * S_C)
+    H_term = delta_H / S_H
+    return math.sqrt(L_term * L_term + C_term * C_term + H_term * H_term)
+
+
+# The matrix functions behind delta_e_batch(), by mode name.
+_MATRIX_DELTA_E_FUNCTIONS = {
+    "cie1976": color_diff_matrix.delta_e_cie1976,
+    "cie1994": color_diff_matrix.delta_e_cie1994,
+    "cie2000": color_diff_matrix.delta_e_cie2000,
+    "cmc": color_diff_matrix.delta_e_cmc,
+}
+
+
+def _get_lab_color_matrix(colors):
+    """
+    Converts a sequence of LabColor objects into an (N, 3) NumPy matrix.
+
+    :rtype: numpy.ndarray
+    """
+    colors = list(colors)
+    for color in colors:
+        _check_lab_color(color)
+    values = numpy.fromiter(
+        (
+            value
+            for color in colors
+            for value in (color.lab_l, color.lab_a, color.lab_b)
+        ),
+        dtype=numpy.float64,
+        count=3 * len(colors),
+    )
+    return values.reshape(-1, 3)
+
+
+def delta_e_batch(color1, colors, mode="cie2000", **kwargs):
+    """
+    Calculates the Delta E of one color against many others at once, using
+    the NumPy functions in :py:mod:`colormath.color_diff_matrix`. This is
+    much faster than calling the Delta E functions above in a loop.
+
+    :param LabColor color1: The reference color.
+    :param colors: The colors to compare against: a sequence of LabColor
+        objects, an (N, 3) matrix of Lab values, or a
+        :py:class:`colormath.color_diff_matrix.PreparedLabMatrix`.
+    :param str mode: One of ``'cie1976'``, ``'cie1994'``, ``'cie2000'`` or
+        ``'cmc'``.
+    :param kwargs: Passed on to the Delta E function for `mode`.
+    :rtype: numpy.ndarray
+    :returns: The Delta E for each color in `colors`, in order.
+    :raises: ValueError if `mode` is not recognized.
+    """
+    try:
+        delta_e_func = _MATRIX_DELTA_E_FUNCTIONS[mode]
+    except KeyError:
+        raise ValueError("Invalid Delta E mode: %s" % mode)
+
+    _check_lab_color(color1)
+    color1_vector = numpy.array(
+        [color1.lab_l, color1.lab_a, color1.lab_b], dtype=numpy.float64
+    )
+    if not isinstance(colors, (numpy.ndarray, color_diff_matrix.PreparedLabMatrix)):
+        colors = _get_lab_color_matrix(colors)
+    return delta_e_func(color1_vector, colors, **kwargs)
@@ -9,7 +9,35 @@ class ColorMathException(Exception):
     Base exception for all colormath exceptions.
     """
 
-    pass
+    # A message assigned to the exception, which takes the place of the one
+    # built by _get_message().
+    _message = None
+
+    def __str__(self):
+        return self.message
+
+    @property
+    def message(self):
+        """
+        A human-readable description of the error. Subclasses build this from
+        their arguments in :py:meth:`_get_message` only when it is asked for,
+        so exceptions that are caught and discarded never pay for the string
+        formatting. It may also be assigned, as in
+        ``self.message = "..."``.
+        """
+        if self._message is not None:
+            return self._message
+        return self._get_message()
+
+    @message.setter
+    def message(self, message):
+        self._message = message
+
+    def _get_message(self):
+        """
+        Builds the message of an exception that has not been assigned one.
+        """
+        return super(ColorMathException, self).__str__()
 
 
 class UndefinedConversionError(ColorMathException):
@@ -19,7 +47,11 @@ class UndefinedConversionError(ColorMathException):
 
     def __init__(self, cobj, cs_to):
         super(UndefinedConversionError, self).__init__(cobj, cs_to)
-        self.message = "Conversion from %s to %s is not defined." % (cobj, cs_to)
+        self.cobj = cobj
+        self.cs_to = cs_to
+
+    def _get_message(self):
+        return "Conversion from %s to %s is not defined." % (self.cobj, self.cs_to)
 
 
 class InvalidIlluminantError(ColorMathException):
@@ -29,7 +61,10 @@ class InvalidIlluminantError(ColorMathException):
 
     def __init__(self, illuminant):
         super(InvalidIlluminantError, self).__init__(illuminant)
-        self.message = "Invalid illuminant specified: %s" % illuminant
+        self.illuminant = illuminant
+
+    def _get_message(self):
+        return "Invalid illuminant specified: %s" % self.illuminant
 
 
 class InvalidObserverError(ColorMathException):
@@ -39,4 +74,10 @@ class InvalidObserverError(ColorMathException):
 
     def __init__(self, cobj):
         super(InvalidObserverError, self).__init__(cobj)
-        self.message = "Invalid observer angle specified: %s" % cobj.observer
+        self.cobj = cobj
+        # Keep the offending value itself, as the object may be changed
+        # before the message is read.
+        self.observer = cobj.observer
+
+    def _get_message(self):
+        return "Invalid observer angle specified: %s" % self.observer
@@ -5,6 +5,7 @@ This module contains classes to represent various color spaces.
 
 import logging
 import math
+import operator
 
 import numpy
 
@@ -15,6 +16,57 @@ from colormath.color_exceptions import InvalidObserverError, InvalidIlluminantEr
 
 logger = logging.getLogger(__name__)
 
+# The characters allowed in the digits of an RGB hex string.
+_HEX_DIGITS = "0123456789abcdefABCDEF"
+# The two digit hex representation of every 8-bit value, for get_rgb_hex().
+_HEX_BYTES = ["%02x" % value for value in range(256)]
+
+# Callables that fetch the VALUES of a color as a tuple, by color class. See
+# ColorBase.get_value_tuple().
+_VALUE_GETTERS = {}
+# Format strings for the VALUES part of str(color), by color class. See
+# ColorBase.__str__().
+_STR_FORMATS = {}
+# Format strings for the VALUES part of repr(color), by color class. See
+# ColorBase.__repr__().
+_REPR_FORMATS = {}
+
+
+def _make_value_getter(value_names):
+    """
+    Builds a callable that returns the named attributes of an object as a
+    tuple. This does the attribute lookups in C, which is much faster than
+    a getattr() loop, particularly for the 50 values of a SpectralColor.
+
+    :param list value_names: The attribute names, in order.
+    """
+    if len(value_names) == 1:
+        # attrgetter() returns the bare value when given a single name.
+        value_name = value_names[0]
+        return lambda color: (getattr(color, value_name),)
+    if not value_names:
+        return lambda color: ()
+    return operator.attrgetter(*value_names)
+
+
+def _strip_rgb_hex(hex_str):
+    """
+    Checks that `hex_str` is an RGB hex string like #RRGGBB.
+
+    :param str hex_str: The hex string, with or without the leading #.
+    :rtype: str
+    :returns: The six hex digits.
+    :raises: ValueError if `hex_str` is not in #RRGGBB format.
+    """
+    colorstring = hex_str.strip()
+    if colorstring[0] == "#":
+        colorstring = colorstring[1:]
+    # int() would also accept signs, underscores and a 0x prefix, so make
+    # sure that only hex digits are present before parsing.
+    if len(colorstring) != 6 or colorstring.strip(_HEX_DIGITS):
+        raise ValueError("input #%s is not in #RRGGBB format" % colorstring)
+    return colorstring
+
 
 class ColorBase(object):
     """
@@ -29,26 +81,71 @@ class ColorBase(object):
     # Allows reversing conversions automatically and accurately.
     _through_rgb_type = None
 
+    @classmethod
+    def from_array(cls, values, **kwargs):
+        """
+        Creates one color for each row of an array of color values. This is
+        much faster than calling the constructor in a loop: the keyword
+        arguments (observer, illuminant, etc) are processed and validated
+        once, and every color starts from a copy of the same attributes.
+
+        :param values: An (N, len(VALUES)) array-like of color values, in the
+            same order as the constructor's positional arguments.
+        :param kwargs: Any other arguments for the constructor.
+        :rtype: list
+        :returns: A list of N instances of this class.
+        """
+        value_names = cls.VALUES
+        rows = numpy.asarray(values, dtype=numpy.float64)
+        rows = rows.reshape(-1, len(value_names)).tolist()
+        template = cls(*([0.0] * len(value_names)), **kwargs).__dict__
+
+        colors = []
+        new_color = object.__new__
+        for row in rows:
+            color = new_color(cls)
+            attributes = template.copy()
+            attributes.update(zip(value_names, row))
+            color.__dict__ = attributes
+            colors.append(color)
+        return colors
+
     def get_value_tuple(self):
         """
         Returns a tuple of the color's values (in order). For example,
         an LabColor object will return (lab_l, lab_a, lab_b), where each
         member of the tuple is the float value for said variable.
         """
-        retval = tuple()
-        for val in self.VALUES:
-            retval += (getattr(self, val),)
-        return retval
+        try:
+            value_getter = _VALUE_GETTERS[self.__class__]
+        except KeyError:
+            value_getter = _make_value_getter(self.VALUES)
+            _VALUE_GETTERS[self.__class__] = value_getter
+        return value_getter(self)
 
     def __str__(self):
         """
         String representation of the color.
         """
-        retval = self.__class__.__name__ + " ("
-        for val in self.VALUES:
-            value = getattr(self, val, None)
-            if value is not None:
-                retval += "%s:%.4f " % (val, getattr(self, val))
+        try:
+            values = self.get_value_tuple()
+        except AttributeError:
+            values = None
+
+        if values is not None and None not in values:
+            try:
+                str_format = _STR_FORMATS[self.__class__]
+            except KeyError:
+                str_format = "".join(val + ":%.4f " for val in self.VALUES)
+                _STR_FORMATS[self.__class__] = str_format
+            retval = self.__class__.__name__ + " (" + str_format % values
+        else:
+            # Leave out any values that are missing.
+            retval = self.__class__.__name__ + " ("
+            for val in self.VALUES:
+                value = getattr(self, val, None)
+                if value is not None:
+                    retval += "%s:%.4f " % (val, value)
         if hasattr(self, "observer"):
             retval += "observer:" + self.observer
         if hasattr(self, "illuminant"):
@@ -59,10 +156,12 @@ class ColorBase(object):
         """
         Evaluable string representation of the object.
         """
-        retval = self.__class__.__name__ + "("
-        attributes = [(attr, getattr(self, attr)) for attr in self.VALUES]
-        values = [x + "=" + repr(y) for x, y in attributes]
-        retval += ", ".join(values)
+        try:
+            repr_format = _REPR_FORMATS[self.__class__]
+        except KeyError:
+            repr_format = ", ".join(val + "=%r" for val in self.VALUES)
+            _REPR_FORMATS[self.__class__] = repr_format
+        retval = self.__class__.__name__ + "(" + repr_format % self.get_value_tuple()
         if hasattr(self, "observer"):
             retval += ", observer='" + self.observer + "'"
         if hasattr(self, "illuminant"):
@@ -116,6 +215,17 @@ class IlluminantMixin(object):
         :param str illuminant: Get the XYZ values for another illuminant.
         :returns: the color's illuminant's XYZ values.
         """
+        illum_x, illum_y, illum_z = self._get_illuminant_xyz_tuple(
+            observer=observer, illuminant=illuminant
+        )
+        return {"X": illum_x, "Y": illum_y, "Z": illum_z}
+
+    def _get_illuminant_xyz_tuple(self, observer=None, illuminant=None):
+        """
+        Like :py:meth:`get_illuminant_xyz`, but returns the (X, Y, Z) tuple
+        straight from :py:data:`colormath.color_constants.ILLUMINANTS`
+        instead of building a dict. The conversion functions use this.
+        """
         try:
             if observer is None:
                 observer = self.observer
@@ -128,12 +238,10 @@ class IlluminantMixin(object):
             if illuminant is None:
                 illuminant = self.illuminant
 
-            illum_xyz = illums_observer[illuminant]
+            return illums_observer[illuminant]
         except (KeyError, AttributeError):
             raise InvalidIlluminantError(illuminant)
 
-        return {"X": illum_xyz[0], "Y": illum_xyz[1], "Z": illum_xyz[2]}
-
 
 class SpectralColor(IlluminantMixin, ColorBase):
     """
@@ -264,63 +372,65 @@ class SpectralColor(IlluminantMixin, ColorBase):
         """
 
         super(SpectralColor, self).__init__()
-        # Spectral fields
-        self.spec_340nm = float(spec_340nm)
-        self.spec_350nm = float(spec_350nm)
-        self.spec_360nm = float(spec_360nm)
-        self.spec_370nm = float(spec_370nm)
-        # begin Blue wavelengths
-        self.spec_380nm = float(spec_380nm)
-        self.spec_390nm = float(spec_390nm)
-        self.spec_400nm = float(spec_400nm)
-        self.spec_410nm = float(spec_410nm)
-        self.spec_420nm = float(spec_420nm)
-        self.spec_430nm = float(spec_430nm)
-        self.spec_440nm = float(spec_440nm)
-        self.spec_450nm = float(spec_450nm)
-        self.spec_460nm = float(spec_460nm)
-        self.spec_470nm = float(spec_470nm)
-        self.spec_480nm = float(spec_480nm)
-        self.spec_490nm = float(spec_490nm)
-        # end Blue wavelengths
-        # start Green wavelengths
-        self.spec_500nm = float(spec_500nm)
-        self.spec_510nm = float(spec_510nm)
-        self.spec_520nm = float(spec_520nm)
-        self.spec_530nm = float(spec_530nm)
-        self.spec_540nm = float(spec_540nm)
-        self.spec_550nm = float(spec_550nm)
-        self.spec_560nm = float(spec_560nm)
-        self.spec_570nm = float(spec_570nm)
-        self.spec_580nm = float(spec_580nm)
-        self.spec_590nm = float(spec_590nm)
-        self.spec_600nm = float(spec_600nm)
-        self.spec_610nm = float(spec_610nm)
-        # end Green wavelengths
-        # start Red wavelengths
-        self.spec_620nm = float(spec_620nm)
-        self.spec_630nm = float(spec_630nm)
-        self.spec_640nm = float(spec_640nm)
-        self.spec_650nm = float(spec_650nm)
-        self.spec_660nm = float(spec_660nm)
-        self.spec_670nm = float(spec_670nm)
-        self.spec_680nm = float(spec_680nm)
-        self.spec_690nm = float(spec_690nm)
-        self.spec_700nm = float(spec_700nm)
-        self.spec_710nm = float(spec_710nm)
-        self.spec_720nm = float(spec_720nm)
-        # end Red wavelengths
-        self.spec_730nm = float(spec_730nm)
-        self.spec_740nm = float(spec_740nm)
-        self.spec_750nm = float(spec_750nm)
-        self.spec_760nm = float(spec_760nm)
-        self.spec_770nm = float(spec_770nm)
-        self.spec_780nm = float(spec_780nm)
-        self.spec_790nm = float(spec_790nm)
-        self.spec_800nm = float(spec_800nm)
-        self.spec_810nm = float(spec_810nm)
-        self.spec_820nm = float(spec_820nm)
-        self.spec_830nm = float(spec_830nm)
+        # Spectral fields. The spec_*nm attributes are properties that read
+        # and write this array; see _spectral_value_property().
+        spectrum = (
+            spec_340nm,
+            spec_350nm,
+            spec_360nm,
+            spec_370nm,
+            spec_380nm,
+            spec_390nm,
+            spec_400nm,
+            spec_410nm,
+            spec_420nm,
+            spec_430nm,
+            spec_440nm,
+            spec_450nm,
+            spec_460nm,
+            spec_470nm,
+            spec_480nm,
+            spec_490nm,
+            spec_500nm,
+            spec_510nm,
+            spec_520nm,
+            spec_530nm,
+            spec_540nm,
+            spec_550nm,
+            spec_560nm,
+            spec_570nm,
+            spec_580nm,
+            spec_590nm,
+            spec_600nm,
+            spec_610nm,
+            spec_620nm,
+            spec_630nm,
+            spec_640nm,
+            spec_650nm,
+            spec_660nm,
+            spec_670nm,
+            spec_680nm,
+            spec_690nm,
+            spec_700nm,
+            spec_710nm,
+            spec_720nm,
+            spec_730nm,
+            spec_740nm,
+            spec_750nm,
+            spec_760nm,
+            spec_770nm,
+            spec_780nm,
+            spec_790nm,
+            spec_800nm,
+            spec_810nm,
+            spec_820nm,
+            spec_830nm,
+        )
+        # Convert each value with float(), like the properties do, so that
+        # bad values such as None raise TypeError instead of becoming NaN.
+        self._spectrum = numpy.array(
+            [float(value) for value in spectrum], dtype=numpy.float64
+        )
 
         #: The color's observer angle. Set with :py:meth:`set_observer`.
         self.observer = None
@@ -330,24 +440,55 @@ class SpectralColor(IlluminantMixin, ColorBase):
         self.set_observer(observer)
         self.set_illuminant(illuminant)
 
+    def __copy__(self):
+        """
+        Copies the color. Unlike the other attributes, the spectral values
+        are copied too, so that the copy doesn't share them with this color.
+        """
+        color = object.__new__(self.__class__)
+        color.__dict__ = self.__dict__.copy()
+        color._spectrum = self._spectrum.copy()
+        return color
+
+    def get_value_tuple(self):
+        """
+        Returns a tuple of the color's spectral values, in wavelength order.
+        """
+        return tuple(self._spectrum.tolist())
+
     def get_numpy_array(self):
         """
         Dump this color into NumPy array.
+
+        .. note:: The returned (1, N) array is a view of the color's own
+            spectral data, so changing it changes the color. Copy it first if
+            you need to modify it.
         """
-        # This holds the obect's spectral data, and will be passed to
-        # numpy.array() to create a numpy array (matrix) for the matrix math
-        # that will be done during the conversion to XYZ.
-        values = []
+        return self._spectrum.reshape(1, -1)
 
-        # Use the required value list to build this dynamically. Default to
-        # 0.0, since that ultimately won't affect the outcome due to the math
-        # involved.
-        for val in self.VALUES:
-            values.append(getattr(self, val, 0.0))
+    @classmethod
+    def from_array(cls, values, **kwargs):
+        """
+        Creates one SpectralColor for each row of an (N, len(VALUES)) array of
+        spectral values. See :py:meth:`ColorBase.from_array`.
 
-        # Create and the actual numpy array/matrix from the spectral list.
-        color_array = numpy.array([values])
-        return color_array
+        :rtype: list
+        """
+        # Copy the values so that the colors don't share data with the
+        # caller's array; each color then keeps one row of the copy.
+        spectra = numpy.array(values, dtype=numpy.float64)
+        spectra = spectra.reshape(-1, len(cls.VALUES))
+        template = cls(**kwargs).__dict__
+
+        colors = []
+        new_color = object.__new__
+        for spectrum in spectra:
+            color = new_color(cls)
+            attributes = template.copy()
+            attributes["_spectrum"] = spectrum
+            color.__dict__ = attributes
+            colors.append(color)
+        return colors
 
     def calc_density(self, density_standard=None):
         """
@@ -362,6 +503,27 @@ class SpectralColor(IlluminantMixin, ColorBase):
             return density.auto_density(self)
 
 
+def _spectral_value_property(index):
+    """
+    Builds the property for one of the spec_*nm values of a SpectralColor,
+    which reads and writes the corresponding element of its _spectrum array.
+
+    :param int index: The position of the value in SpectralColor.VALUES.
+    """
+
+    def fget(self):
+        return float(self._spectrum[index])
+
+    def fset(self, value):
+        self._spectrum[index] = float(value)
+
+    return property(fget, fset)
+
+
+for _index, _value_name in enumerate(SpectralColor.VALUES):
+    setattr(SpectralColor, _value_name, _spectral_value_property(_index))
+
+
 class LabColor(IlluminantMixin, ColorBase):
     """
     Represents a CIE Lab color. For more information on CIE Lab,
@@ -619,6 +781,27 @@ class BaseRGBColor(ColorBase):
             self.rgb_b = float(rgb_b)
         self.is_upscaled = is_upscaled
 
+    @classmethod
+    def from_array(cls, values, is_upscaled=False):
+        """
+        Creates one RGB color for each row of an (N, 3) array of RGB values.
+        See :py:meth:`ColorBase.from_array`.
+
+        :keyword bool is_upscaled: If True, the values are between 0 and 255
+            instead of 0.0 and 1.0.
+        :rtype: list
+        """
+        if not is_upscaled:
+            return super(BaseRGBColor, cls).from_array(values)
+
+        # Scale the whole array at once, as the constructor would do for
+        # each color.
+        values = numpy.asarray(values, dtype=numpy.float64) / 255.0
+        colors = super(BaseRGBColor, cls).from_array(values)
+        for color in colors:
+            color.is_upscaled = True
+        return colors
+
     def _clamp_rgb_coordinate(self, coord):
         """
         Clamps an RGB coordinate, taking into account whether or not the
@@ -654,6 +837,21 @@ class BaseRGBColor(ColorBase):
         """
         return self._clamp_rgb_coordinate(self.rgb_b)
 
+    def get_clamped_value_tuple(self):
+        """
+        Returns the clamped (rgb_r, rgb_g, rgb_b) values, like reading the
+        three ``clamped_rgb_*`` properties, but with a single check of
+        whether or not the color is upscaled.
+
+        :rtype: tuple
+        """
+        upper = 255.0 if self.is_upscaled else 1.0
+        return (
+            min(max(self.rgb_r, 0.0), upper),
+            min(max(self.rgb_g, 0.0), upper),
+            min(max(self.rgb_b, 0.0), upper),
+        )
+
     def get_upscaled_value_tuple(self):
         """
         Scales an RGB color object from decimal 0.0-1.0 to int 0-255.
@@ -671,8 +869,15 @@ class BaseRGBColor(ColorBase):
 
         :rtype: str
         """
-        rgb_r, rgb_g, rgb_b = self.get_upscaled_value_tuple()
-        return "#%02x%02x%02x" % (rgb_r, rgb_g, rgb_b)
+        # Clamp out of gamut values, which would otherwise produce more than
+        # two digits, before scaling them up like get_upscaled_value_tuple().
+        # The scaled values are never negative, so int() rounds them down.
+        return (
+            "#"
+            + _HEX_BYTES[int(0.5 + min(max(self.rgb_r, 0.0), 1.0) * 255)]
+            + _HEX_BYTES[int(0.5 + min(max(self.rgb_g, 0.0), 1.0) * 255)]
+            + _HEX_BYTES[int(0.5 + min(max(self.rgb_b, 0.0), 1.0) * 255)]
+        )
 
     @classmethod
     def new_from_rgb_hex(cls, hex_str):
@@ -682,13 +887,11 @@ class BaseRGBColor(ColorBase):
 
         :rtype: sRGBColor
         """
-        colorstring = hex_str.strip()
-        if colorstring[0] == "#":
-            colorstring = colorstring[1:]
-        if len(colorstring) != 6:
-            raise ValueError("input #%s is not in #RRGGBB format" % colorstring)
-        r, g, b = colorstring[:2], colorstring[2:4], colorstring[4:]
-        r, g, b = [int(n, 16) / 255.0 for n in (r, g, b)]
+        # Parse all three channels at once and split them with bit operations.
+        value = int(_strip_rgb_hex(hex_str), 16)
+        r = (value >> 16) / 255.0
+        g = ((value >> 8) & 0xFF) / 255.0
+        b = (value & 0xFF) / 255.0
         return cls(r, g, b)
 
 
@@ -976,4 +1179,9 @@ class IPTColor(ColorBase):
 
     @property
     def hue_angle(self):
-        return numpy.arctan2(self.ipt_t, self.ipt_p)
+        ipt_p, ipt_t = self.ipt_p, self.ipt_t
+        if isinstance(ipt_p, (float, int)) and isinstance(ipt_t, (float, int)):
+            return math.atan2(ipt_t, ipt_p)
+        # The coordinates aren't converted to floats, so they may also be
+        # arrays of values.
+        return numpy.arctan2(ipt_t, ipt_p)
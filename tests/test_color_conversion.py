@@ -3,19 +3,28 @@ import itertools
 import numpy as np
 import unittest
 from colormath import color_conversions
+from colormath import color_conversions_matrix
 from colormath.color_conversions import (
     GraphConversionManager,
     XYZ_to_RGB,
     HSV_to_RGB,
     RGB_to_XYZ,
 )
-from colormath.color_exceptions import UndefinedConversionError
+from colormath.color_exceptions import InvalidIlluminantError, UndefinedConversionError
 from colormath.color_objects import (
     XYZColor,
     BaseRGBColor,
     HSVColor,
     HSLColor,
     AdobeRGBColor,
+    LabColor,
+    LCHabColor,
+    LCHuvColor,
+    LuvColor,
+    xyYColor,
+    CMYColor,
+    CMYKColor,
+    SpectralColor,
     BT2020Color,
     sRGBColor,
 )
@@ -35,6 +44,16 @@ class GraphConversionManagerTestCase(unittest.TestCase):
         path = self.manager.get_conversion_path(XYZColor, XYZColor)
         self.assertEqual(path, [])
 
+    def test_path_cache_invalidation(self):
+        """
+        Registering a new conversion replaces any previously cached path.
+        """
+        self.assertEqual(len(self.manager.get_conversion_path(XYZColor, HSVColor)), 2)
+        self.manager.add_type_conversion(XYZColor, HSVColor, XYZ_to_RGB)
+        self.assertEqual(
+            self.manager.get_conversion_path(XYZColor, HSVColor), [XYZ_to_RGB]
+        )
+
     def test_invalid_path_response(self):
         self.assertRaises(
             UndefinedConversionError,
@@ -85,3 +104,248 @@ class ColorConversionTestCase(unittest.TestCase):
                 rtol=1e-5,
                 atol=1e-5,
             )
+
+
+class ConversionMatrixTestCase(unittest.TestCase):
+    """
+    The matrix conversions must match the single-color conversions.
+    """
+
+    def setUp(self):
+        self.xyz_colors = [
+            XYZColor(0.1, 0.2, 0.3),
+            XYZColor(0.9, 0.8, 0.5),
+            XYZColor(0.001, 0.002, 0.001),
+            XYZColor(0.0, 0.0, 0.0),
+        ]
+        self.xyz_matrix = np.array([c.get_value_tuple() for c in self.xyz_colors])
+
+    def assert_matches(self, matrix, colors, target_cs, **kwargs):
+        expected = [
+            color_conversions.convert_color(c, target_cs, **kwargs).get_value_tuple()
+            for c in colors
+        ]
+        np.testing.assert_allclose(matrix, expected, rtol=1e-9, atol=1e-9)
+
+    def test_xyz_round_trips(self):
+        for color_cs, to_matrix, from_matrix in (
+            (LabColor, "XYZ_to_Lab", "Lab_to_XYZ"),
+            (LuvColor, "XYZ_to_Luv", "Luv_to_XYZ"),
+            (xyYColor, "XYZ_to_xyY", "xyY_to_XYZ"),
+        ):
+            kwargs = {}
+            if color_cs is not xyYColor:
+                kwargs = {"observer": "2", "illuminant": "d50"}
+            converted = getattr(color_conversions_matrix, to_matrix)(
+                self.xyz_matrix, **kwargs
+            )
+            self.assert_matches(converted, self.xyz_colors, color_cs)
+
+            colors = [color_cs(*row) for row in converted]
+            back = getattr(color_conversions_matrix, from_matrix)(converted, **kwargs)
+            self.assert_matches(back, colors, XYZColor)
+
+    def test_lch(self):
+        lab_matrix = color_conversions_matrix.XYZ_to_Lab(self.xyz_matrix)
+        lab_colors = [LabColor(*row) for row in lab_matrix]
+        lch_matrix = color_conversions_matrix.Lab_to_LCHab(lab_matrix)
+        self.assert_matches(lch_matrix, lab_colors, LCHabColor)
+        lch_colors = [LCHabColor(*row) for row in lch_matrix]
+        self.assert_matches(
+            color_conversions_matrix.LCHab_to_Lab(lch_matrix), lch_colors, LabColor
+        )
+
+        luv_matrix = color_conversions_matrix.XYZ_to_Luv(self.xyz_matrix)
+        luv_colors = [LuvColor(*row) for row in luv_matrix]
+        self.assert_matches(
+            color_conversions_matrix.Luv_to_LCHuv(luv_matrix), luv_colors, LCHuvColor
+        )
+
+    def test_rgb(self):
+        for rgb_type in (sRGBColor, AdobeRGBColor, BT2020Color):
+            rgb_matrix = color_conversions_matrix.XYZ_to_RGB(
+                self.xyz_matrix, rgb_type, illuminant="d50"
+            )
+            self.assert_matches(rgb_matrix, self.xyz_colors, rgb_type)
+
+            rgb_colors = [rgb_type(*row) for row in rgb_matrix]
+            xyz_matrix = color_conversions_matrix.RGB_to_XYZ(
+                rgb_matrix, rgb_type, target_illuminant="d50"
+            )
+            self.assert_matches(
+                xyz_matrix, rgb_colors, XYZColor, target_illuminant="d50"
+            )
+
+    def test_image_shape(self):
+        image = self.xyz_matrix.reshape(2, 2, 3)
+        lab_image = color_conversions_matrix.XYZ_to_Lab(image)
+        self.assertEqual(lab_image.shape, (2, 2, 3))
+        np.testing.assert_allclose(
+            lab_image.reshape(-1, 3),
+            color_conversions_matrix.XYZ_to_Lab(self.xyz_matrix),
+        )
+
+    def test_invalid_shape(self):
+        self.assertRaises(
+            ValueError, color_conversions_matrix.XYZ_to_Lab, np.zeros((4, 2))
+        )
+
+    def test_convert_color_matrix(self):
+        rgb_colors = [sRGBColor(0.1, 0.5, 0.9), sRGBColor(1.0, 0.0, 0.02)]
+        rgb_matrix = np.array([c.get_value_tuple() for c in rgb_colors])
+        for target_cs in (
+            LabColor,
+            LCHuvColor,
+            xyYColor,
+            CMYColor,
+            CMYKColor,
+            sRGBColor,
+        ):
+            converted = color_conversions_matrix.convert_color_matrix(
+                rgb_matrix, sRGBColor, target_cs
+            )
+            self.assert_matches(converted, rgb_colors, target_cs)
+
+        converted = color_conversions_matrix.convert_color_matrix(
+            rgb_matrix, sRGBColor, LabColor, target_illuminant="d65"
+        )
+        self.assert_matches(converted, rgb_colors, LabColor, target_illuminant="d65")
+
+        lab_colors = [LabColor(50.0, 20.0, -30.0, illuminant="d65")]
+        converted = color_conversions_matrix.convert_color_matrix(
+            [c.get_value_tuple() for c in lab_colors],
+            LabColor,
+            CMYColor,
+            through_rgb_type=AdobeRGBColor,
+            illuminant="d65",
+        )
+        self.assert_matches(
+            converted, lab_colors, CMYColor, through_rgb_type=AdobeRGBColor
+        )
+
+    def test_convert_color_matrix_undefined(self):
+        self.assertRaises(
+            UndefinedConversionError,
+            color_conversions_matrix.convert_color_matrix,
+            self.xyz_matrix,
+            XYZColor,
+            HSVColor,
+        )
+
+    def test_uint8_rgb(self):
+        rgb_matrix = np.array([[0, 10, 11], [128, 200, 255]], dtype=np.uint8)
+        for rgb_type in (sRGBColor, AdobeRGBColor, BT2020Color):
+            for target_cs in (XYZColor, LabColor, CMYColor):
+                np.testing.assert_allclose(
+                    color_conversions_matrix.convert_color_matrix(
+                        rgb_matrix, rgb_type, target_cs
+                    ),
+                    color_conversions_matrix.convert_color_matrix(
+                        rgb_matrix / 255.0, rgb_type, target_cs
+                    ),
+                    rtol=1e-12,
+                    atol=1e-12,
+                )
+
+    def test_float32(self):
+        rgb_matrix = np.array([[0.1, 0.5, 0.9], [1.0, 0.0, 0.02]])
+        for target_cs in (LabColor, LCHuvColor, xyYColor, AdobeRGBColor):
+            converted = color_conversions_matrix.convert_color_matrix(
+                rgb_matrix.astype(np.float32), sRGBColor, target_cs
+            )
+            self.assertEqual(converted.dtype, np.float32)
+            np.testing.assert_allclose(
+                converted,
+                color_conversions_matrix.convert_color_matrix(
+                    rgb_matrix, sRGBColor, target_cs
+                ),
+                rtol=1e-4,
+                atol=1e-4,
+            )
+
+    def test_cmyk(self):
+        cmy_colors = [CMYColor(0.2, 0.5, 0.9), CMYColor(1.0, 1.0, 1.0)]
+        cmy_matrix = np.array([c.get_value_tuple() for c in cmy_colors])
+        cmyk_matrix = color_conversions_matrix.CMY_to_CMYK(cmy_matrix)
+        self.assert_matches(cmyk_matrix, cmy_colors, CMYKColor)
+        cmyk_colors = [CMYKColor(*row) for row in cmyk_matrix]
+        self.assert_matches(
+            color_conversions_matrix.CMYK_to_CMY(cmyk_matrix), cmyk_colors, CMYColor
+        )
+
+    def test_spectral(self):
+        spectral_matrix = np.random.RandomState(0).rand(3, len(SpectralColor.VALUES))
+        for illuminant in ("d50", "d65"):
+            spectral_colors = SpectralColor.from_array(
+                spectral_matrix, observer="10", illuminant=illuminant
+            )
+            for target_cs in (XYZColor, LabColor):
+                converted = color_conversions_matrix.convert_color_matrix(
+                    spectral_matrix,
+                    SpectralColor,
+                    target_cs,
+                    observer="10",
+                    illuminant=illuminant,
+                )
+                self.assert_matches(converted, spectral_colors, target_cs)
+
+    def test_rgb_to_hex(self):
+        rgb_colors = [
+            sRGBColor(0.0, 0.5, 1.0),
+            sRGBColor(1.2, -0.1, 0.123),
+            sRGBColor(0.998, 0.002, 0.5),
+        ]
+        rgb_matrix = np.array([c.get_value_tuple() for c in rgb_colors])
+        expected = [c.get_rgb_hex() for c in rgb_colors]
+        self.assertEqual(color_conversions_matrix.RGB_to_hex(rgb_matrix), expected)
+        self.assertEqual(
+            color_conversions_matrix.RGB_to_hex(
+                np.array([[0, 128, 255]], dtype=np.uint8)
+            ),
+            ["#0080ff"],
+        )
+
+        # NaN values are rejected, as they are by get_rgb_hex().
+        nan_color = sRGBColor(0.5, float("nan"), 0.5)
+        self.assertRaises(ValueError, nan_color.get_rgb_hex)
+        self.assertRaises(
+            ValueError,
+            color_conversions_matrix.RGB_to_hex,
+            np.array([nan_color.get_value_tuple()]),
+        )
+
+    def test_hex_to_rgb(self):
+        hex_strings = ["#0080ff", "a1B2c3", " #000000 "]
+        rgb_matrix = color_conversions_matrix.hex_to_RGB(hex_strings)
+        self.assertEqual(rgb_matrix.shape, (3, 3))
+        for row, hex_str in zip(rgb_matrix, hex_strings):
+            color = sRGBColor.new_from_rgb_hex(hex_str)
+            self.assertEqual(tuple(row), color.get_value_tuple())
+        self.assertEqual(color_conversions_matrix.hex_to_RGB([]).shape, (0, 3))
+        self.assertRaises(
+            ValueError, color_conversions_matrix.hex_to_RGB, ["#0080ff", "#00 80f"]
+        )
+
+    def test_apply_chromatic_adaptation(self):
+        xyz_colors = [
+            XYZColor(0.1, 0.2, 0.3, illuminant="d50"),
+            XYZColor(0.9, 0.5, 0.01, illuminant="d50"),
+        ]
+        xyz_matrix = np.array([c.get_value_tuple() for c in xyz_colors])
+        for adaptation in ("bradford", "von_kries"):
+            adapted = color_conversions_matrix.apply_chromatic_adaptation(
+                xyz_matrix, "d50", "D65", adaptation=adaptation
+            )
+            for row, color in zip(adapted, xyz_colors):
+                expected = XYZColor(*color.get_value_tuple(), illuminant="d50")
+                expected.apply_adaptation("d65", adaptation=adaptation)
+                np.testing.assert_allclose(
+                    row, expected.get_value_tuple(), rtol=1e-9, atol=1e-9
+                )
+        self.assertRaises(
+            InvalidIlluminantError,
+            color_conversions_matrix.apply_chromatic_adaptation,
+            xyz_matrix,
+            "d50",
+            "foo",
+        )
@@ -5,7 +5,11 @@ Tests for color difference (Delta E) equations.
 
 import unittest
 
+import numpy
+
+from colormath import color_diff_matrix
 from colormath.color_diff import (
+    delta_e_batch,
     delta_e_cie1976,
     delta_e_cie1994,
     delta_e_cie2000,
@@ -288,3 +292,193 @@ class DeltaETestCase(unittest.TestCase):
     def test_non_lab_color(self):
         other_color = sRGBColor(1.0, 0.5, 0.3)
         self.assertRaises(ValueError, delta_e_cie2000, self.color1, other_color)
+
+
+class DeltaEBatchTestCase(unittest.TestCase):
+    def setUp(self):
+        self.color1 = LabColor(lab_l=0.9, lab_a=16.3, lab_b=-2.22)
+        self.colors = [
+            LabColor(lab_l=0.7, lab_a=14.2, lab_b=-1.80),
+            LabColor(lab_l=50.0, lab_a=-1.0, lab_b=2.0),
+            LabColor(lab_l=83.386, lab_a=39.426, lab_b=-17.525),
+        ]
+
+    def test_matches_pairwise(self):
+        """
+        Each mode gives the same results as the single pair functions.
+        """
+        for mode, func in (
+            ("cie1976", delta_e_cie1976),
+            ("cie1994", delta_e_cie1994),
+            ("cie2000", delta_e_cie2000),
+            ("cmc", delta_e_cmc),
+        ):
+            numpy.testing.assert_allclose(
+                delta_e_batch(self.color1, self.colors, mode=mode),
+                [func(self.color1, color) for color in self.colors],
+            )
+
+    def test_invalid_mode(self):
+        self.assertRaises(
+            ValueError, delta_e_batch, self.color1, self.colors, mode="nope"
+        )
+
+    def test_non_lab_color(self):
+        self.assertRaises(
+            ValueError,
+            delta_e_batch,
+            self.color1,
+            [sRGBColor(1, 1, 1)],
+        )
+
+
+class DeltaEMatrixTestCase(unittest.TestCase):
+    def setUp(self):
+        self.lab_vector = numpy.array([0.9, 16.3, -2.22])
+        self.lab_matrix = numpy.array(
+            [(0.7, 14.2, -1.80), (50.0, -1.0, 2.0), (83.386, 39.426, -17.525)]
+        )
+
+    def test_out_parameter(self):
+        """
+        Results are written into a caller-supplied buffer when given one.
+        """
+        for func in (
+            color_diff_matrix.delta_e_cie1976,
+            color_diff_matrix.delta_e_cie1994,
+            color_diff_matrix.delta_e_cie2000,
+            color_diff_matrix.delta_e_cmc,
+        ):
+            expected = func(self.lab_vector, self.lab_matrix)
+            out = numpy.empty(len(self.lab_matrix))
+            result = func(self.lab_vector, self.lab_matrix, out=out)
+            self.assertIs(result, out)
+            numpy.testing.assert_allclose(out, expected)
+
+    def test_prepared_matrix(self):
+        """
+        A PreparedLabMatrix gives the same results as the raw matrix.
+        """
+        prepared = color_diff_matrix.PreparedLabMatrix(self.lab_matrix)
+        for func in (
+            color_diff_matrix.delta_e_cie1976,
+            color_diff_matrix.delta_e_cie1994,
+            color_diff_matrix.delta_e_cie2000,
+            color_diff_matrix.delta_e_cmc,
+        ):
+            numpy.testing.assert_allclose(
+                func(self.lab_vector, prepared),
+                func(self.lab_vector, self.lab_matrix),
+            )
+
+    def test_integer_input(self):
+        """
+        Integer Lab values are accepted, and computed as floats.
+        """
+        lab_vector = numpy.array([1, 16, -2])
+        lab_matrix = numpy.array([(1, 14, -2), (50, -1, 2), (83, 39, -18)])
+        for func in (
+            color_diff_matrix.delta_e_cie1976,
+            color_diff_matrix.delta_e_cie1994,
+            color_diff_matrix.delta_e_cie2000,
+            color_diff_matrix.delta_e_cmc,
+        ):
+            numpy.testing.assert_allclose(
+                func(lab_vector, lab_matrix),
+                func(lab_vector.astype(float), lab_matrix.astype(float)),
+            )
+
+    def test_cmc_pairwise(self):
+        """
+        The pairwise CMC matrix matches comparing each row on its own.
+        """
+        result = color_diff_matrix.delta_e_cmc_pairwise(
+            self.lab_matrix, self.lab_matrix, pl=1, pc=1
+        )
+        self.assertEqual(result.shape, (3, 3))
+        for i, lab_vector in enumerate(self.lab_matrix):
+            numpy.testing.assert_allclose(
+                result[i],
+                color_diff_matrix.delta_e_cmc(lab_vector, self.lab_matrix, pl=1, pc=1),
+            )
+
+    def test_cie2000_soa(self):
+        """
+        The SoA entry point matches the vector/matrix one.
+        """
+        L2, a2, b2 = color_diff_matrix.split_lab_matrix(self.lab_matrix)
+        L1, a1, b1 = self.lab_vector
+        numpy.testing.assert_allclose(
+            color_diff_matrix.delta_e_cie2000_soa(L1, a1, b1, L2, a2, b2),
+            color_diff_matrix.delta_e_cie2000(self.lab_vector, self.lab_matrix),
+        )
+        # Both colors may be given as scalars.
+        L2, a2, b2 = self.lab_matrix[0]
+        self.assertAlmostEqual(
+            float(color_diff_matrix.delta_e_cie2000_soa(L1, a1, b1, L2, a2, b2)),
+            color_diff_matrix.delta_e_cie2000(self.lab_vector, self.lab_matrix)[0],
+        )
+
+    def test_float32_variants(self):
+        """
+        The float32 variants compute in single precision and agree with the
+        float64 functions.
+        """
+        for func, func_f32 in (
+            (color_diff_matrix.delta_e_cie1976, color_diff_matrix.delta_e_cie1976_f32),
+            (color_diff_matrix.delta_e_cie1994, color_diff_matrix.delta_e_cie1994_f32),
+            (color_diff_matrix.delta_e_cie2000, color_diff_matrix.delta_e_cie2000_f32),
+            (color_diff_matrix.delta_e_cmc, color_diff_matrix.delta_e_cmc_f32),
+        ):
+            result = func_f32(self.lab_vector, self.lab_matrix)
+            self.assertEqual(result.dtype, numpy.float32)
+            # The plain functions compute in float64, even for float32 input.
+            self.assertEqual(
+                func(
+                    self.lab_vector.astype(numpy.float32),
+                    self.lab_matrix.astype(numpy.float32),
+                ).dtype,
+                numpy.float64,
+            )
+            numpy.testing.assert_allclose(
+                result, func(self.lab_vector, self.lab_matrix), rtol=1e-4
+            )
+
+    def test_nearest_cie2000(self):
+        """
+        The nearest and top-k searches agree with sorting the full result.
+        """
+        delta_e = color_diff_matrix.delta_e_cie2000(self.lab_vector, self.lab_matrix)
+        order = numpy.argsort(delta_e)
+
+        index, distance = color_diff_matrix.nearest_cie2000(
+            self.lab_vector, self.lab_matrix
+        )
+        self.assertEqual(index, order[0])
+        self.assertAlmostEqual(distance, delta_e[order[0]])
+        self.assertRaises(
+            ValueError,
+            color_diff_matrix.nearest_cie2000,
+            self.lab_vector,
+            numpy.empty((0, 3)),
+        )
+
+        for k in (1, 2, 5):
+            indices, distances = color_diff_matrix.topk_cie2000(
+                self.lab_vector, self.lab_matrix, k
+            )
+            numpy.testing.assert_array_equal(indices, order[:k])
+            numpy.testing.assert_allclose(distances, delta_e[order[:k]])
+
+        indices, distances = color_diff_matrix.topk_cie2000(
+            self.lab_vector, self.lab_matrix, 0
+        )
+        self.assertEqual(len(indices), 0)
+        self.assertEqual(len(distances), 0)
+        self.assertRaises(
+            ValueError,
+            color_diff_matrix.topk_cie2000,
+            self.lab_vector,
+            self.lab_matrix,
+            -1,
+        )
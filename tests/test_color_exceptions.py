@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the colormath exceptions.
+"""
+
+import unittest
+
+from colormath.color_exceptions import (
+    ColorMathException,
+    InvalidIlluminantError,
+)
+
+
+class ColorMathExceptionTestCase(unittest.TestCase):
+    def test_lazy_message(self):
+        exc = InvalidIlluminantError("foo")
+        self.assertEqual(exc.message, "Invalid illuminant specified: foo")
+        self.assertEqual(str(exc), exc.message)
+
+    def test_assigned_message(self):
+        class CustomError(ColorMathException):
+            def __init__(self, value):
+                super(CustomError, self).__init__(value)
+                self.message = "Custom error: %s" % value
+
+        exc = CustomError("foo")
+        self.assertEqual(exc.message, "Custom error: foo")
+        self.assertEqual(str(exc), "Custom error: foo")
+
+        exc = InvalidIlluminantError("foo")
+        exc.message = "Replaced"
+        self.assertEqual(exc.message, "Replaced")
+        self.assertEqual(str(exc), "Replaced")
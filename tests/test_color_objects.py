@@ -3,8 +3,13 @@
 Various tests for color objects.
 """
 
+import copy
+import math
 import unittest
 
+import numpy
+
+from colormath import spectral_constants
 from colormath.color_conversions import convert_color
 from colormath.color_objects import (
     SpectralColor,
@@ -105,6 +110,14 @@ class SpectralConversionTestCase(BaseColorConversionTest):
         xyz = convert_color(self.color, XYZColor)
         self.assertColorMatch(xyz, XYZColor(0.115, 0.099, 0.047))
 
+    def test_conversion_to_xyz_with_illuminant_override(self):
+        xyz = convert_color(
+            self.color,
+            XYZColor,
+            illuminant_override=spectral_constants.REF_ILLUM_TABLE["d50"],
+        )
+        self.assertColorMatch(xyz, XYZColor(0.115, 0.099, 0.047))
+
     def test_conversion_to_xyz_with_negatives(self):
         """
         This has negative spectral values, which should never happen. Just
@@ -119,6 +132,39 @@ class SpectralConversionTestCase(BaseColorConversionTest):
         same_color = convert_color(self.color, SpectralColor)
         self.assertEqual(self.color, same_color)
 
+    def test_numpy_array_matches_values(self):
+        """
+        The spectral values and the NumPy array share the same data.
+        """
+        self.color.spec_550nm = 0.5
+        spectrum = self.color.get_numpy_array()
+        self.assertEqual(spectrum.shape, (1, len(SpectralColor.VALUES)))
+        self.assertEqual(tuple(spectrum[0]), self.color.get_value_tuple())
+        self.assertEqual(spectrum[0, SpectralColor.VALUES.index("spec_550nm")], 0.5)
+
+    def test_copy(self):
+        """
+        A copy doesn't share its spectral values with the original.
+        """
+        self.color.spec_400nm = 0.25
+        for copy_func in (copy.copy, copy.deepcopy):
+            color_copy = copy_func(self.color)
+            color_copy.spec_400nm = 0.75
+            self.assertEqual(self.color.spec_400nm, 0.25)
+            self.assertEqual(color_copy.illuminant, self.color.illuminant)
+
+    def test_invalid_value(self):
+        """
+        Invalid spectral values are rejected, whether passed to the
+        constructor or set afterwards.
+        """
+        self.assertRaises(TypeError, SpectralColor, spec_550nm=None)
+
+        def _set_invalid_value():
+            self.color.spec_550nm = None
+
+        self.assertRaises(TypeError, _set_invalid_value)
+
 
 class XYZConversionTestCase(BaseColorConversionTest):
     def setUp(self):
@@ -193,6 +239,29 @@ class LabConversionTestCase(BaseColorConversionTest):
         same_color = convert_color(self.color, LabColor)
         self.assertEqual(self.color, same_color)
 
+    def test_str(self):
+        self.assertEqual(
+            str(self.color),
+            "LabColor (lab_l:1.8070 lab_a:-3.7490 lab_b:-2.5470 "
+            "observer:2 illuminant:d50)",
+        )
+        # Missing values are left out.
+        self.color.lab_a = None
+        self.assertEqual(
+            str(self.color),
+            "LabColor (lab_l:1.8070 lab_b:-2.5470 observer:2 illuminant:d50)",
+        )
+
+    def test_repr(self):
+        self.assertEqual(
+            repr(self.color),
+            "LabColor(lab_l=1.807, lab_a=-3.749, lab_b=-2.547, "
+            "observer='2', illuminant='d50')",
+        )
+        self.assertEqual(
+            repr(sRGBColor(0.5, 0.25, 1)), "sRGBColor(rgb_r=0.5, rgb_g=0.25, rgb_b=1.0)"
+        )
+
 
 class LuvConversionTestCase(BaseColorConversionTest):
     def setUp(self):
@@ -305,6 +374,14 @@ class RGBConversionTestCase(BaseColorConversionTest):
         self.assertEqual(low_b.clamped_rgb_g, low_b.rgb_g)
         self.assertEqual(low_b.clamped_rgb_b, 0.0)
 
+    def test_get_clamped_value_tuple(self):
+        color = sRGBColor(1.482, -0.1, 0.3)
+        self.assertEqual(color.get_clamped_value_tuple(), (1.0, 0.0, 0.3))
+        self.assertEqual(
+            color.get_clamped_value_tuple(),
+            (color.clamped_rgb_r, color.clamped_rgb_g, color.clamped_rgb_b),
+        )
+
     def test_to_xyz_and_back(self):
         xyz = convert_color(self.color, XYZColor)
         rgb = convert_color(xyz, sRGBColor)
@@ -404,6 +481,14 @@ class RGBConversionTestCase(BaseColorConversionTest):
         rgb = sRGBColor.new_from_rgb_hex("#7bc832")
         self.assertColorMatch(rgb, sRGBColor(0.482, 0.784, 0.196))
 
+    def test_get_rgb_hex_out_of_gamut(self):
+        hex_str = sRGBColor(1.2, -0.1, 0.5).get_rgb_hex()
+        self.assertEqual(hex_str, "#ff0080")
+
+    def test_set_from_invalid_rgb_hex(self):
+        for hex_str in ("#7bc83", "#7bc8zz", "0x7bc8", "#-7bc83"):
+            self.assertRaises(ValueError, sRGBColor.new_from_rgb_hex, hex_str)
+
 
 class HSLConversionTestCase(BaseColorConversionTest):
     def setUp(self):
@@ -498,3 +583,38 @@ class IPTConversionTestCase(BaseColorConversionTest):
             return convert_color(xyz, IPTColor)
 
         self.assertRaises(ValueError, _ipt_conversion)
+
+    def test_hue_angle(self):
+        self.assertAlmostEqual(self.color.hue_angle, math.pi / 4)
+        self.assertAlmostEqual(IPTColor(0.5, -0.5, -0.5).hue_angle, -3 * math.pi / 4)
+
+        color = IPTColor(0.5, numpy.array([0.5, -0.5]), numpy.array([0.5, -0.5]))
+        numpy.testing.assert_allclose(color.hue_angle, [math.pi / 4, -3 * math.pi / 4])
+        color = IPTColor(0.5, numpy.array([0.5]), numpy.array([0.5]))
+        self.assertEqual(color.hue_angle.shape, (1,))
+
+
+class FromArrayTestCase(unittest.TestCase):
+    def test_lab_from_array(self):
+        colors = LabColor.from_array(
+            [(1.0, 2.0, 3.0), (4.0, 5.0, 6.0)], observer="10", illuminant="d65"
+        )
+        self.assertEqual(len(colors), 2)
+        self.assertEqual(colors[1].get_value_tuple(), (4.0, 5.0, 6.0))
+        self.assertEqual(colors[1].observer, "10")
+        self.assertEqual(colors[1].illuminant, "d65")
+        # Each color must have its own attributes.
+        colors[0].lab_l = 50.0
+        self.assertEqual(colors[1].lab_l, 4.0)
+
+    def test_rgb_from_array_upscaled(self):
+        colors = sRGBColor.from_array([(255, 0, 51)], is_upscaled=True)
+        self.assertEqual(colors[0].get_value_tuple(), (1.0, 0.0, 0.2))
+        self.assertTrue(colors[0].is_upscaled)
+
+    def test_spectral_from_array(self):
+        values = [[0.1] * len(SpectralColor.VALUES), [0.2] * len(SpectralColor.VALUES)]
+        colors = SpectralColor.from_array(values, illuminant="d65")
+        colors[0].spec_550nm = 0.5
+        self.assertEqual(colors[1].spec_550nm, 0.2)
+        self.assertEqual(colors[1].illuminant, "d65")